@@ -1,79 +1,105 @@
-from itertools import product, combinations
+from itertools import combinations
 from typing import List, Tuple, Set, Dict
+import logging
 import random
+import sys
 from collections import defaultdict
+from minesweeper_ai import UNKNOWN, FLAG, encode_board, encode_cell, decode_board, neighbor_table
 
 
 class AdvancedMinesweeperAI:
     """Advanced AI with constraint satisfaction and probability reasoning."""
     
-    def __init__(self, board: List[List]):
+    def __init__(self, board: List[List], verbose: bool = False):
         """
         board: 2D list
         -1 = unknown
         0-8 = revealed numbers
         'F' = flagged mine
+        verbose: log every deduction at DEBUG level (off for interactive use)
         """
-        self.board = board
+        self.board = encode_board(board)
         self.rows = len(board)
         self.cols = len(board[0])
         self.mines_found = set()
         self.safe_cells = set()
         self.probabilities = {}
-        # caches to speed up repeated neighbour lookups
-        self._neighbor_cache = {}
+        self.verbose = verbose
+        self.logger = logging.getLogger(__name__)
+        # neighbour table shared by all solvers on this board size
+        self._neighbors = neighbor_table(self.rows, self.cols)
 
-    def get_neighbors(self, r: int, c: int) -> List[Tuple[int, int]]:
+    def get_neighbors(self, r: int, c: int) -> Tuple[Tuple[int, int], ...]:
         """Get all valid neighboring cells."""
-        key = (r, c)
-        if key in self._neighbor_cache:
-            return self._neighbor_cache[key]
+        return self._neighbors[r][c]
 
-        neighbors = []
-        for dr, dc in product([-1, 0, 1], repeat=2):
-            if dr == 0 and dc == 0:
-                continue
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < self.rows and 0 <= nc < self.cols:
-                neighbors.append((nr, nc))
+    def apply_update(self, cell_changes: Dict[Tuple[int, int], object]):
+        """Apply player moves made since the last solve.
 
-        self._neighbor_cache[key] = neighbors
-        return neighbors
+        cell_changes maps (r, c) to the cell's new value (-1, 0-8 or 'F').
+        Deductions about other cells are kept, so the next solve() resumes
+        from them instead of starting over - unless a cell went back to
+        unknown (a flag was removed). Deductions may have rested on that
+        flag, so they are all dropped and re-derived from the board.
+        """
+        lost_information = False
+        for (r, c), value in cell_changes.items():
+            code = encode_cell(value)
+            self.board[r][c] = code
+            if code == UNKNOWN:
+                lost_information = True
+            # The player has acted on this cell; it is no longer a pending hint
+            self.safe_cells.discard((r, c))
+            self.mines_found.discard((r, c))
+
+        if lost_information:
+            # Deduced cells are stored on the board as 0 / FLAG; undo them
+            for r, c in self.safe_cells | self.mines_found:
+                self.board[r][c] = UNKNOWN
+            self.safe_cells.clear()
+            self.mines_found.clear()
+
+        if cell_changes:
+            self.probabilities = {}
 
     def basic_logical_step(self) -> bool:
         """Perform basic logical deduction (Rules 1 & 2)."""
         changed = False
+        board = self.board
+        neighbors_of = self._neighbors
 
         for r in range(self.rows):
             for c in range(self.cols):
-                if isinstance(self.board[r][c], int) and self.board[r][c] > 0:
-                    neighbors = self.get_neighbors(r, c)
+                number = board[r][c]
+                if 0 < number <= 8:
+                    neighbors = neighbors_of[r][c]
                     unknown = []
                     flagged = 0
 
                     for nr, nc in neighbors:
-                        if self.board[nr][nc] == -1:
+                        v = board[nr][nc]
+                        if v == UNKNOWN:
                             unknown.append((nr, nc))
-                        elif self.board[nr][nc] == 'F':
+                        elif v == FLAG:
                             flagged += 1
 
-                    number = self.board[r][c]
-
                     # Rule 1: All unknown are safe
                     if flagged == number and unknown:
                         for ur, uc in unknown:
-                            if self.board[ur][uc] == -1:
-                                print(f"Safe (Rule 1): ({ur},{uc})")
-                                self.board[ur][uc] = 0
+                            if board[ur][uc] == UNKNOWN:
+                                if self.verbose:
+                                    self.logger.debug("Safe (Rule 1): (%d,%d)", ur, uc)
+                                board[ur][uc] = 0
                                 self.safe_cells.add((ur, uc))
                                 changed = True
 
                     # Rule 2: All unknown are mines
                     elif len(unknown) + flagged == number and unknown:
                         for ur, uc in unknown:
-                            if self.board[ur][uc] == -1:
-                                print(f"Mine (Rule 2): ({ur},{uc})")
-                                self.board[ur][uc] = 'F'
+                            if board[ur][uc] == UNKNOWN:
+                                if self.verbose:
+                                    self.logger.debug("Mine (Rule 2): (%d,%d)", ur, uc)
+                                board[ur][uc] = FLAG
                                 self.mines_found.add((ur, uc))
                                 changed = True
 
@@ -82,23 +108,27 @@ class AdvancedMinesweeperAI:
     def get_constraint_variables(self) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
         """Get all constraint variables (unknown cells adjacent to numbered cells)."""
         constraints = {}
+        board = self.board
+        neighbors_of = self._neighbors
         
         for r in range(self.rows):
             for c in range(self.cols):
-                if isinstance(self.board[r][c], int) and self.board[r][c] > 0:
-                    neighbors = self.get_neighbors(r, c)
+                number = board[r][c]
+                if 0 < number <= 8:
+                    neighbors = neighbors_of[r][c]
                     unknown_neighbors = []
                     flagged = 0
                     
                     for nr, nc in neighbors:
-                        if self.board[nr][nc] == -1:
+                        v = board[nr][nc]
+                        if v == UNKNOWN:
                             unknown_neighbors.append((nr, nc))
-                        elif self.board[nr][nc] == 'F':
+                        elif v == FLAG:
                             flagged += 1
                     
                     if unknown_neighbors:
                         # Store: (r,c) -> [(unknown_neighbors), remaining_mines_needed]
-                        constraints[(r, c)] = (unknown_neighbors, self.board[r][c] - flagged)
+                        constraints[(r, c)] = (unknown_neighbors, number - flagged)
         
         return constraints
 
@@ -136,8 +166,9 @@ class AdvancedMinesweeperAI:
                     if diff_mines == 0 and diff_cells:
                         # All diff_cells are safe
                         for ur, uc in diff_cells:
-                            if self.board[ur][uc] == -1:
-                                print(f"Safe (Subset): ({ur},{uc})")
+                            if self.board[ur][uc] == UNKNOWN:
+                                if self.verbose:
+                                    self.logger.debug("Safe (Subset): (%d,%d)", ur, uc)
                                 self.board[ur][uc] = 0
                                 self.safe_cells.add((ur, uc))
                                 changed = True
@@ -145,9 +176,10 @@ class AdvancedMinesweeperAI:
                     elif len(diff_cells) == diff_mines and diff_cells:
                         # All diff_cells are mines
                         for ur, uc in diff_cells:
-                            if self.board[ur][uc] == -1:
-                                print(f"Mine (Subset): ({ur},{uc})")
-                                self.board[ur][uc] = 'F'
+                            if self.board[ur][uc] == UNKNOWN:
+                                if self.verbose:
+                                    self.logger.debug("Mine (Subset): (%d,%d)", ur, uc)
+                                self.board[ur][uc] = FLAG
                                 self.mines_found.add((ur, uc))
                                 changed = True
 
@@ -249,7 +281,7 @@ class AdvancedMinesweeperAI:
         if not self.probabilities:
             # No constraints, pick random unknown
             unknown_cells = [(r, c) for r in range(self.rows) for c in range(self.cols) 
-                           if self.board[r][c] == -1]
+                           if self.board[r][c] == UNKNOWN]
             if unknown_cells:
                 return random.choice(unknown_cells)
             return None
@@ -260,48 +292,60 @@ class AdvancedMinesweeperAI:
 
     def solve(self, use_probabilities: bool = True):
         """Run the complete solver with all techniques."""
-        print("🧠 Starting Advanced AI Solver...")
+        verbose = self.verbose
+        log = self.logger.debug
+        if verbose:
+            log("🧠 Starting Advanced AI Solver...")
         step = 0
         
         # Phase 1: Basic logical deduction
-        print("📐 Phase 1: Basic logical deduction")
+        if verbose:
+            log("📐 Phase 1: Basic logical deduction")
         while self.basic_logical_step():
             step += 1
-            print(f"  Step {step} completed")
+            if verbose:
+                log("  Step %d completed", step)
         
         # Phase 2: Constraint satisfaction
-        print("🔗 Phase 2: Constraint satisfaction")
+        if verbose:
+            log("🔗 Phase 2: Constraint satisfaction")
         constraint_steps = 0
         while self.constraint_satisfaction_step():
             constraint_steps += 1
-            print(f"  Constraint step {constraint_steps} completed")
+            if verbose:
+                log("  Constraint step %d completed", constraint_steps)
             # Try basic logic again after each constraint step
             while self.basic_logical_step():
                 step += 1
-                print(f"  Basic logic step {step} completed")
+                if verbose:
+                    log("  Basic logic step %d completed", step)
         
         # Phase 3: Probability calculation
         if use_probabilities:
-            print("📊 Phase 3: Probability analysis")
+            if verbose:
+                log("📊 Phase 3: Probability analysis")
             probabilities = self.calculate_probabilities()
             if probabilities:
-                print("  Mine probabilities calculated:")
-                for cell, prob in sorted(probabilities.items()):
-                    if prob > 0:
-                        print(f"    ({cell[0]},{cell[1]}): {prob:.3f}")
-                
                 best_guess = self.get_best_guess()
-                if best_guess:
-                    print(f"  🎯 Best guess: ({best_guess[0]},{best_guess[1]}) with {probabilities[best_guess]:.3f} mine probability")
+                if verbose:
+                    log("  Mine probabilities calculated:")
+                    for cell, prob in sorted(probabilities.items()):
+                        if prob > 0:
+                            log("    (%d,%d): %.3f", cell[0], cell[1], prob)
+                    if best_guess:
+                        log("  🎯 Best guess: (%d,%d) with %.3f mine probability",
+                            best_guess[0], best_guess[1], probabilities[best_guess])
         
-        print(f"✅ Advanced solving complete. Found {len(self.mines_found)} mines, {len(self.safe_cells)} safe cells.")
+        if verbose:
+            log("✅ Advanced solving complete. Found %d mines, %d safe cells.",
+                len(self.mines_found), len(self.safe_cells))
         
         return self.mines_found, self.safe_cells, self.probabilities
 
     def print_board(self):
         """Print the current board state."""
         print("\nCurrent Board:")
-        for row in self.board:
+        for row in decode_board(self.board):
             print(' '.join(str(cell).rjust(2) for cell in row))
         print()
 
@@ -324,7 +368,7 @@ def test_advanced_solver():
         print(' '.join(str(cell).rjust(2) for cell in row))
     print()
     
-    ai = AdvancedMinesweeperAI(board)
+    ai = AdvancedMinesweeperAI(board, verbose=True)
     mines, safe, probs = ai.solve()
     
     print("\nFinal board:")
@@ -352,7 +396,7 @@ def test_probability_scenario():
         print(' '.join(str(cell).rjust(2) for cell in row))
     print()
     
-    ai = AdvancedMinesweeperAI(board)
+    ai = AdvancedMinesweeperAI(board, verbose=True)
     mines, safe, probs = ai.solve()
     
     print("\nFinal board:")
@@ -366,5 +410,6 @@ def test_probability_scenario():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
     test_advanced_solver()
     test_probability_scenario()
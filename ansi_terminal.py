@@ -0,0 +1,30 @@
+"""
+ANSI terminal helpers shared by the terminal front ends.
+"""
+
+import os
+
+# Erase the screen and home the cursor
+CLEAR_SCREEN = '\x1b[2J\x1b[H'
+
+
+def enable_ansi_terminal() -> bool:
+    """Make sure the terminal understands ANSI escapes; False if it cannot.
+    
+    POSIX terminals always do. Windows 10+ consoles need virtual terminal
+    processing switched on once per process.
+    """
+    if os.name != 'nt':
+        return True
+    
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
@@ -13,6 +13,8 @@ Run this file to see all the AI capabilities in action!
 
 from minesweeper_ai import MinesweeperAI, MinesweeperGame
 from advanced_solver import AdvancedMinesweeperAI
+import logging
+import sys
 import time
 import random
 
@@ -35,7 +37,7 @@ def demo_basic_solver():
         print(' '.join(str(cell).rjust(3) for cell in row))
     print()
     
-    ai = MinesweeperAI(board)
+    ai = MinesweeperAI(board, verbose=True)
     mines, safe = ai.solve()
     
     print("\nFinal board:")
@@ -63,7 +65,7 @@ def demo_constraint_satisfaction():
         print(' '.join(str(cell).rjust(3) for cell in row))
     print()
     
-    ai = AdvancedMinesweeperAI(board)
+    ai = AdvancedMinesweeperAI(board, verbose=True)
     mines, safe, probs = ai.solve()
     
     print("\nFinal board:")
@@ -93,7 +95,7 @@ def demo_probability_guessing():
         print(' '.join(str(cell).rjust(3) for cell in row))
     print()
     
-    ai = AdvancedMinesweeperAI(board)
+    ai = AdvancedMinesweeperAI(board, verbose=True)
     mines, safe, probs = ai.solve()
     
     print("\nFinal board:")
@@ -148,12 +150,12 @@ def demo_random_game():
     
     # Run basic solver first
     print("🔍 Running basic solver...")
-    basic_ai = MinesweeperAI([row[:] for row in player_board])
+    basic_ai = MinesweeperAI([row[:] for row in player_board], verbose=True)
     basic_mines, basic_safe = basic_ai.solve()
     
     # Then run advanced solver
     print("\n🧠 Running advanced solver...")
-    advanced_ai = AdvancedMinesweeperAI(player_board)
+    advanced_ai = AdvancedMinesweeperAI(player_board, verbose=True)
     adv_mines, adv_safe, probs = advanced_ai.solve()
     
     # Check accuracy
@@ -263,4 +265,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
     main()
@@ -9,11 +9,13 @@ from tkinter import ttk, messagebox, simpledialog
 import random
 import json
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass, asdict
 from advanced_solver import AdvancedMinesweeperAI
+from minesweeper_ai import neighbor_table, flat_neighbor_table
 
 
 @dataclass
@@ -85,6 +87,7 @@ class MinesweeperGUI:
         self.root.title("Minesweeper AI - Production Edition")
         self.root.configure(bg=self.COLORS['bg'])
         self.root.resizable(False, False)
+        self._init_styles()
         
         # Game state
         self.setup_game()
@@ -100,6 +103,20 @@ class MinesweeperGUI:
         self.create_gui()
         self.logger.info("GUI Minesweeper initialized")
     
+    def _init_styles(self):
+        """Build the button options for every cell state once."""
+        colors = self.COLORS
+        self._cell_styles = {
+            'unknown': {'text': "", 'bg': colors['cell_unknown']},
+            'flag': {'text': "🚩", 'bg': colors['cell_flag']},
+            'mine': {'text': "💣", 'bg': colors['cell_mine'],
+                     'fg': colors['text'], 'relief': tk.SUNKEN},
+            0: {'text': "", 'bg': colors['cell_revealed'], 'relief': tk.SUNKEN},
+        }
+        for n in range(1, 9):
+            self._cell_styles[n] = {'text': str(n), 'bg': colors['cell_revealed'],
+                                    'fg': colors['numbers'][n - 1], 'relief': tk.SUNKEN}
+    
     def setup_logging(self):
         """Setup logging system."""
         log_dir = Path.home() / ".minesweeper_ai"
@@ -177,6 +194,13 @@ class MinesweeperGUI:
         self.cols = preset.get("cols", self.config.cols)
         self.mines = preset.get("mines", self.config.mines)
         
+        # Flat-index geometry: cell (r, c) is r * cols + c
+        cols = self.cols
+        self._size = self.rows * cols
+        # Shared per-size adjacency, by (r, c) and by flat index
+        self._neighbors = neighbor_table(self.rows, cols)
+        self._flat_neighbors = flat_neighbor_table(self.rows, cols)
+        
         self.board = [[-1 for _ in range(self.cols)] for _ in range(self.rows)]
         self.mine_positions = set()
         self.game_over = False
@@ -186,6 +210,10 @@ class MinesweeperGUI:
         self.revealed_count = 0
         self.ai_hints = {'mines': set(), 'safe': set(), 'probs': {}}
         
+        # Long-lived solver fed with the cells changed since the last hint
+        self._ai = None
+        self._ai_changes = {}
+        
         self.logger.info(f"Game setup: {self.rows}x{self.cols} with {self.mines} mines")
     
     def create_gui(self):
@@ -249,22 +277,21 @@ class MinesweeperGUI:
                               relief=tk.RAISED,
                               bd=2)
                 btn.grid(row=r, column=c, padx=1, pady=1)
-                btn.bind('<Button-1>', lambda e, row=r, col=c: self.left_click(row, col))
-                btn.bind('<Button-3>', lambda e, row=r, col=c: self.right_click(row, col))
+                btn._rc = (r, c)
+                btn.bind('<Button-1>', self._on_left_click)
+                btn.bind('<Button-3>', self._on_right_click)
                 button_row.append(btn)
             self.buttons.append(button_row)
     
-    def get_neighbors(self, r: int, c: int) -> List[Tuple[int, int]]:
-        """Get all valid neighboring cells."""
-        neighbors = []
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:
-                    continue
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < self.rows and 0 <= nc < self.cols:
-                    neighbors.append((nr, nc))
-        return neighbors
+    def _on_left_click(self, event):
+        """Dispatch a left click from any board button to its cell."""
+        r, c = event.widget._rc
+        self.left_click(r, c, event)
+    
+    def _on_right_click(self, event):
+        """Dispatch a right click from any board button to its cell."""
+        r, c = event.widget._rc
+        self.right_click(r, c, event)
     
     def place_mines(self, safe_row: int, safe_col: int):
         """Place mines randomly, avoiding first clicked cell."""
@@ -277,20 +304,20 @@ class MinesweeperGUI:
         except ValueError as e:
             self.logger.error(f"Failed to place mines: {e}")
             raise
-    
-    def calculate_numbers(self):
-        """Calculate numbers for each cell."""
-        self.internal_board = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
         
+        mine_bits = bytearray(self._size)
         for r, c in self.mine_positions:
-            self.internal_board[r][c] = -1
+            mine_bits[r * self.cols + c] = 1
+        self._mine_bits = mine_bits
+    
+    def count_adjacent_mines(self, idx: int) -> int:
+        """Count the mines around flat cell index idx.
         
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.internal_board[r][c] != -1:
-                    count = sum(1 for nr, nc in self.get_neighbors(r, c) 
-                               if (nr, nc) in self.mine_positions)
-                    self.internal_board[r][c] = count
+        Numbers are computed only for cells that actually get revealed,
+        instead of for the whole board up front.
+        """
+        mine_bits = self._mine_bits
+        return sum(mine_bits[ni] for ni in self._flat_neighbors[idx])
     
     def left_click(self, r: int, c: int, event=None):
         """Handle left click on cell."""
@@ -302,9 +329,8 @@ class MinesweeperGUI:
         
         if self.first_click:
             self.place_mines(r, c)
-            self.calculate_numbers()
             self.first_click = False
-            self.game_start_time = datetime.now().timestamp()
+            self.game_start_time = time.monotonic()
             self.timer_running = True
             self.logger.info("Game started")
         
@@ -333,14 +359,15 @@ class MinesweeperGUI:
                 return
             
             # Reveal the cell
-            self.board[r][c] = self.internal_board[r][c]
+            self.board[r][c] = self.count_adjacent_mines(r * self.cols + c)
+            self._ai_changes[(r, c)] = self.board[r][c]
             self.revealed_count += 1
             
             # Update button
             self.update_button(r, c)
             
             # If it's a 0, reveal all adjacent cells
-            if self.internal_board[r][c] == 0:
+            if self.board[r][c] == 0:
                 self.reveal_area(r, c)
             
             # Check win condition
@@ -356,53 +383,55 @@ class MinesweeperGUI:
     
     def reveal_area(self, r: int, c: int):
         """Reveal connected area of zeros."""
-        to_reveal = [(r, c)]
-        revealed = set()
+        cols = self.cols
+        # Cells are tracked by flat index r * cols + c; visited is a bitmap
+        flat_neighbors = self._flat_neighbors
+        neighbors = self._neighbors
+        to_reveal = [r * cols + c]
+        visited = bytearray(self.rows * cols)
         
         while to_reveal:
-            cr, cc = to_reveal.pop()
-            if (cr, cc) in revealed:
+            idx = to_reveal.pop()
+            if visited[idx]:
                 continue
-            revealed.add((cr, cc))
+            visited[idx] = 1
             
-            for nr, nc in self.get_neighbors(cr, cc):
-                if self.board[nr][nc] == -1 and (nr, nc) not in self.mine_positions:
-                    self.board[nr][nc] = self.internal_board[nr][nc]
+            # Both tables list a cell's neighbours in the same order
+            r, c = divmod(idx, cols)
+            for ni, (nr, nc) in zip(flat_neighbors[idx], neighbors[r][c]):
+                if self.board[nr][nc] == -1 and not self._mine_bits[ni]:
+                    self.board[nr][nc] = self.count_adjacent_mines(ni)
+                    self._ai_changes[(nr, nc)] = self.board[nr][nc]
                     self.revealed_count += 1
                     self.update_button(nr, nc)
                     
-                    if self.internal_board[nr][nc] == 0:
-                        to_reveal.append((nr, nc))
+                    if self.board[nr][nc] == 0:
+                        to_reveal.append(ni)
     
     def toggle_flag(self, r: int, c: int):
         """Toggle flag on a cell."""
         if (r, c) in self.flags:
             self.flags.remove((r, c))
-            self.buttons[r][c].config(text="", bg=self.COLORS['cell_unknown'])
+            self._ai_changes[(r, c)] = -1
+            self.buttons[r][c].configure(self._cell_styles['unknown'])
         else:
             self.flags.add((r, c))
+            self._ai_changes[(r, c)] = 'F'
             self.stats.flags_placed += 1
-            self.buttons[r][c].config(text="🚩", bg=self.COLORS['cell_flag'])
+            self.buttons[r][c].configure(self._cell_styles['flag'])
         
         self.update_mine_count()
     
     def update_button(self, r: int, c: int):
         """Update button appearance based on cell value."""
-        value = self.board[r][c]
-        btn = self.buttons[r][c]
-        
-        if value == 0:
-            btn.config(text="", bg=self.COLORS['cell_revealed'], relief=tk.SUNKEN)
-        elif isinstance(value, int) and value > 0:
-            color = self.COLORS['numbers'][value - 1]
-            btn.config(text=str(value), bg=self.COLORS['cell_revealed'], 
-                      fg=color, relief=tk.SUNKEN)
+        style = self._cell_styles.get(self.board[r][c])
+        if style is not None:
+            self.buttons[r][c].configure(style)
     
     def reveal_all_mines(self):
         """Reveal all mines when game is over."""
         for r, c in self.mine_positions:
-            self.buttons[r][c].config(text="💣", bg=self.COLORS['cell_mine'], 
-                                     fg=self.COLORS['text'], relief=tk.SUNKEN)
+            self.buttons[r][c].configure(self._cell_styles['mine'])
     
     def update_mine_count(self):
         """Update mine counter."""
@@ -412,7 +441,7 @@ class MinesweeperGUI:
     def update_timer(self):
         """Update game timer."""
         if self.timer_running and self.game_start_time:
-            elapsed = int(datetime.now().timestamp() - self.game_start_time)
+            elapsed = int(time.monotonic() - self.game_start_time)
             self.time_label.config(text=f"Time: {elapsed}s")
         
         self.root.after(1000, self.update_timer)
@@ -420,7 +449,7 @@ class MinesweeperGUI:
     def end_game(self, won: bool):
         """Handle game end."""
         if self.game_start_time:
-            game_time = datetime.now().timestamp() - self.game_start_time
+            game_time = time.monotonic() - self.game_start_time
             self.stats.total_time += game_time
             
             if won and (self.stats.best_time == float('inf') or game_time < self.stats.best_time):
@@ -460,20 +489,28 @@ class MinesweeperGUI:
             return set(), set(), {}
         
         try:
-            ai_board = [row[:] for row in self.board]
-            
-            for r, c in self.flags:
-                if ai_board[r][c] == -1:
-                    ai_board[r][c] = 'F'
+            if self._ai is None:
+                ai_board = [row[:] for row in self.board]
+                
+                for r, c in self.flags:
+                    if ai_board[r][c] == -1:
+                        ai_board[r][c] = 'F'
+                
+                self._ai = AdvancedMinesweeperAI(ai_board, verbose=False)
+            else:
+                self._ai.apply_update(self._ai_changes)
+            self._ai_changes = {}
             
-            ai = AdvancedMinesweeperAI(ai_board)
-            mines, safe, probs = ai.solve()
+            mines, safe, probs = self._ai.solve()
             
             self.stats.ai_suggestions_used += 1
-            return mines, safe, probs
+            return set(mines), set(safe), dict(probs)
             
         except Exception as e:
             self.logger.error(f"Error getting AI suggestions: {e}")
+            # Rebuild from the full board on the next request
+            self._ai = None
+            self._ai_changes = {}
             return set(), set(), {}
     
     def show_ai_hints(self):
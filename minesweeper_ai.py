@@ -1,67 +1,131 @@
+from functools import lru_cache
 from itertools import product
 from typing import List, Tuple, Set
+import logging
 import random
+import sys
+
+# Integer cell codes used inside the solvers. Revealed numbers keep their
+# value (0-8) so "is a clue" is a plain range test.
+UNKNOWN = 9
+FLAG = 10
+MINE = 11
+
+# Solver codes map to themselves so already-encoded boards pass through
+_ENCODE = {-1: UNKNOWN, 'F': FLAG, 'M': MINE,
+           **{code: code for code in (*range(9), UNKNOWN, FLAG, MINE)}}
+_DECODE = {UNKNOWN: -1, FLAG: 'F', MINE: 'M'}
+
+
+def encode_cell(cell) -> int:
+    """Convert one player-board cell to its solver cell code.
+
+    Raises ValueError for anything that is not -1, 0-8, 'F', 'M' or
+    already a solver cell code.
+    """
+    try:
+        return _ENCODE[cell]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid board cell: {cell!r}") from None
+
+
+def encode_board(board: List[List]) -> List[List[int]]:
+    """Convert a player board (-1 / 0-8 / 'F' / 'M') to solver cell codes."""
+    return [[encode_cell(cell) for cell in row] for row in board]
+
+
+def decode_board(board: List[List[int]]) -> List[List]:
+    """Convert solver cell codes back to the player board representation."""
+    return [[_DECODE.get(cell, cell) for cell in row] for row in board]
+
+
+@lru_cache(maxsize=None)
+def neighbor_table(rows: int, cols: int) -> Tuple[Tuple[Tuple[Tuple[int, int], ...], ...], ...]:
+    """Neighbours of every cell for a rows x cols board, indexed [r][c].
+
+    Bounds are resolved once per board size, so edge and corner cells
+    simply have shorter entries and the solvers' inner loops need no
+    range checks. Tables are shared by every solver on the same size.
+    """
+    return tuple(
+        tuple(
+            tuple((r + dr, c + dc) for dr, dc in product([-1, 0, 1], repeat=2)
+                  if (dr or dc) and 0 <= r + dr < rows and 0 <= c + dc < cols)
+            for c in range(cols)
+        )
+        for r in range(rows)
+    )
+
+
+@lru_cache(maxsize=None)
+def flat_neighbor_table(rows: int, cols: int) -> Tuple[Tuple[int, ...], ...]:
+    """neighbor_table() with cells as flat indices r * cols + c, indexed [idx]."""
+    return tuple(
+        tuple(nr * cols + nc for nr, nc in cell)
+        for row in neighbor_table(rows, cols) for cell in row
+    )
 
 
 class MinesweeperAI:
-    def __init__(self, board: List[List]):
+    def __init__(self, board: List[List], verbose: bool = False):
         """
         board: 2D list
         -1 = unknown
         0-8 = revealed numbers
         'F' = flagged mine
+        verbose: log every deduction at DEBUG level (off for interactive use)
         """
-        self.board = board
+        self.board = encode_board(board)
         self.rows = len(board)
         self.cols = len(board[0])
         self.mines_found = set()
         self.safe_cells = set()
+        self.verbose = verbose
+        self.logger = logging.getLogger(__name__)
+        self._neighbors = neighbor_table(self.rows, self.cols)
 
-    def get_neighbors(self, r: int, c: int) -> List[Tuple[int, int]]:
+    def get_neighbors(self, r: int, c: int) -> Tuple[Tuple[int, int], ...]:
         """Get all valid neighboring cells."""
-        neighbors = []
-        for dr, dc in product([-1, 0, 1], repeat=2):
-            if dr == 0 and dc == 0:
-                continue
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < self.rows and 0 <= nc < self.cols:
-                neighbors.append((nr, nc))
-        return neighbors
+        return self._neighbors[r][c]
 
     def solve_step(self) -> bool:
         """Perform one step of logical deduction. Returns True if any changes were made."""
         changed = False
+        board = self.board
+        neighbors_of = self._neighbors
 
         for r in range(self.rows):
             for c in range(self.cols):
-                if isinstance(self.board[r][c], int) and self.board[r][c] > 0:
-                    neighbors = self.get_neighbors(r, c)
+                number = board[r][c]
+                if 0 < number <= 8:
+                    neighbors = neighbors_of[r][c]
                     unknown = []
                     flagged = 0
 
                     for nr, nc in neighbors:
-                        if self.board[nr][nc] == -1:
+                        v = board[nr][nc]
+                        if v == UNKNOWN:
                             unknown.append((nr, nc))
-                        elif self.board[nr][nc] == 'F':
+                        elif v == FLAG:
                             flagged += 1
 
-                    number = self.board[r][c]
-
                     # Rule 1: All unknown are safe (if we already found all mines)
                     if flagged == number and unknown:
                         for ur, uc in unknown:
-                            if self.board[ur][uc] == -1:
-                                print(f"Safe: ({ur},{uc})")
-                                self.board[ur][uc] = 0  # Mark as safe (simulate reveal)
+                            if board[ur][uc] == UNKNOWN:
+                                if self.verbose:
+                                    self.logger.debug("Safe: (%d,%d)", ur, uc)
+                                board[ur][uc] = 0  # Mark as safe (simulate reveal)
                                 self.safe_cells.add((ur, uc))
                                 changed = True
 
                     # Rule 2: All unknown are mines (if remaining unknown = remaining mines)
                     elif len(unknown) + flagged == number and unknown:
                         for ur, uc in unknown:
-                            if self.board[ur][uc] == -1:
-                                print(f"Mine: ({ur},{uc})")
-                                self.board[ur][uc] = 'F'
+                            if board[ur][uc] == UNKNOWN:
+                                if self.verbose:
+                                    self.logger.debug("Mine: (%d,%d)", ur, uc)
+                                board[ur][uc] = FLAG
                                 self.mines_found.add((ur, uc))
                                 changed = True
 
@@ -69,25 +133,29 @@ class MinesweeperAI:
 
     def solve(self):
         """Run the logical solver until no more deductions can be made."""
-        print("🔍 Starting logical deduction...")
+        if self.verbose:
+            self.logger.debug("🔍 Starting logical deduction...")
         step = 0
         while self.solve_step():
             step += 1
-            print(f"Step {step} completed")
+            if self.verbose:
+                self.logger.debug("Step %d completed", step)
         
-        print(f"✅ Logical deduction complete. Found {len(self.mines_found)} mines, {len(self.safe_cells)} safe cells.")
-        print("No more logical moves available.")
+        if self.verbose:
+            self.logger.debug("✅ Logical deduction complete. Found %d mines, %d safe cells.",
+                              len(self.mines_found), len(self.safe_cells))
+            self.logger.debug("No more logical moves available.")
         
         return self.mines_found, self.safe_cells
 
     def get_board_state(self) -> List[List]:
         """Return current board state."""
-        return self.board
+        return decode_board(self.board)
 
     def print_board(self):
         """Print the current board state."""
         print("\nCurrent Board:")
-        for row in self.board:
+        for row in decode_board(self.board):
             print(' '.join(str(cell).rjust(2) for cell in row))
         print()
 
@@ -157,7 +225,7 @@ def test_basic_solver():
         print(' '.join(str(cell).rjust(2) for cell in row))
     print()
     
-    ai = MinesweeperAI(board)
+    ai = MinesweeperAI(board, verbose=True)
     mines, safe = ai.solve()
     
     print("\nFinal board:")
@@ -193,7 +261,7 @@ def test_random_game():
         print(' '.join(str(cell).rjust(2) for cell in row))
     print()
     
-    ai = MinesweeperAI(player_board)
+    ai = MinesweeperAI(player_board, verbose=True)
     mines, safe = ai.solve()
     
     print("\nFinal board:")
@@ -206,5 +274,6 @@ def test_random_game():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
     test_basic_solver()
     test_random_game()
@@ -6,7 +6,17 @@ Shows the logic feed and probability calculations without pygame
 
 import time
 import random
-from neural_ui_system import NeuralUISystem
+from neural_ui_system import NeuralUISystem, LOG_TYPE_ICONS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Demos fall back to plain Python arithmetic
+
+# Pre-joined bars for the text demos, indexed by length
+_BLOCKS = tuple("█" * i for i in range(21))
+_RISK_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+_FADES = tuple("▓" * (5 - i) + "░" * i for i in range(6))
 
 
 def print_cyberpunk_header():
@@ -27,8 +37,12 @@ def print_probability_demo():
     print("-" * 40)
     
     probabilities = [0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0]
+    if np is not None:
+        glow_lengths = (np.array(probabilities) * 10).astype(int).tolist()
+    else:
+        glow_lengths = [int(prob * 10) for prob in probabilities]
     
-    for prob in probabilities:
+    for prob, glow_length in zip(probabilities, glow_lengths):
         # Simulate the color coding
         if prob < 0.1:
             color = "🟢 GREEN (Safe)"
@@ -50,7 +64,7 @@ def print_probability_demo():
         
         # Simulate neon glow effect
         glow_intensity = "⚡" if prob > 0.5 else "✨"
-        print(f"    Neon Glow: {glow_intensity} {'█' * int(prob * 10)}")
+        print(f"    Neon Glow: {glow_intensity} {_BLOCKS[glow_length]}")
         print()
 
 
@@ -86,15 +100,7 @@ def print_logic_feed_demo():
         log_type = log_entry['type']
         
         # Simulate color coding with emojis
-        type_icons = {
-            "SOLVE": "🟢",
-            "LOGIC": "🔵", 
-            "PROB": "🟡",
-            "FOGIC": "🟣",
-            "ERROR": "🔴"
-        }
-        
-        icon = type_icons.get(log_type, "⚪")
+        icon = LOG_TYPE_ICONS.get(log_type, "⚪")
         print(f"  {icon} {log_text}")
     
     print()
@@ -114,7 +120,7 @@ def print_risk_slider_demo():
     
     for level, name, icon, description in risk_levels:
         bar_length = int(level * 20)
-        bar = "█" * bar_length + "░" * (20 - bar_length)
+        bar = _RISK_BARS[bar_length]
         print(f"  {icon} {name:12} [{bar}] {description}")
     
     print()
@@ -151,16 +157,21 @@ def print_animation_demo():
     print("✨ ANIMATION SYSTEM DEMONSTRATION:")
     print("-" * 40)
     
+    # Compute every frame's values up front; the loops below only print
+    if np is not None:
+        intensities = (128 + 127 * (np.arange(5) / 4)).astype(int).tolist()
+    else:
+        intensities = [int(128 + 127 * (i / 4)) for i in range(5)]
+    alphas = [255 - i * 50 for i in range(5)]
+    
     print("🌟 Pulsing Neon Effects:")
-    for i in range(5):
-        intensity = int(128 + 127 * (i / 4))
-        bar = "█" * (i + 1)
+    for i, intensity in enumerate(intensities):
+        bar = _BLOCKS[i + 1]
         print(f"  Frame {i+1}: {bar} (Intensity: {intensity})")
     
     print("\n🔄 Fade Effects:")
-    for i in range(5):
-        alpha = 255 - (i * 50)
-        fade_bar = "▓" * (5 - i) + "░" * i
+    for i, alpha in enumerate(alphas):
+        fade_bar = _FADES[i]
         print(f"  Fade {i+1}: {fade_bar} (Alpha: {alpha})")
     
     print()
@@ -7,13 +7,66 @@ Demonstrates all features without pygame dependency
 import time
 import random
 import math
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Demos fall back to math.sin
+
+
+# Probability buckets for the description lookup table. The thresholds
+# (0.1, 0.3, 0.6, 0.8) fall exactly on bucket edges.
+PROB_STEPS = 1000
+
+# Entries kept in the logic feed; older ones drop off the front
+MAX_LOGS = 12
+
+
+def _probability_description(prob):
+    """Return (color description, icon) for a mine probability."""
+    if prob < 0.1:
+        return "GREEN (Safe)", "🟢"
+    elif prob < 0.3:
+        return "CYAN (Low Risk)", "🟦"
+    elif prob < 0.6:
+        return "YELLOW (Medium Risk)", "🟡"
+    elif prob < 0.8:
+        return "ORANGE (High Risk)", "🟠"
+    else:
+        return "RED (Very High Risk)", "🔴"
+
+
+# Precomputed descriptions for every probability bucket, built once at import
+_PROB_DESC_LUT = tuple(_probability_description(i / PROB_STEPS) for i in range(PROB_STEPS + 1))
+
+
+def probability_color(prob):
+    """Return (color description, icon) for a mine probability."""
+    return _PROB_DESC_LUT[min(PROB_STEPS, max(0, int(prob * PROB_STEPS)))]
+
+
+# Pre-joined bars for the text demos, indexed by length
+_BLOCKS = tuple("█" * i for i in range(21))
+_RISK_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+_FADES = tuple("▓" * (5 - i) + "░" * i for i in range(6))
+_WAVES = tuple("∿" * i for i in range(10))
+
+# Logic feed icon per log type; anything else gets a white circle
+_LOG_ICONS = {
+    "SOLVE": "🟢",
+    "LOGIC": "🔵",
+    "PROB": "🟡",
+    "FOGIC": "🟣",
+    "ERROR": "🔴"
+}
 
 
 class NeuralUISystem:
     """Standalone version of Neural UI System for demonstration."""
     
     def __init__(self):
-        self.logic_logs = []
+        self.logic_logs = deque(maxlen=MAX_LOGS)
         self.risk_level = 0.5
         self.animation_time = 0
         
@@ -27,37 +80,19 @@ class NeuralUISystem:
             'timestamp': timestamp,
             'alpha': 255
         })
-        
-        if len(self.logic_logs) > 12:
-            self.logic_logs.pop(0)
     
     def set_risk_level(self, level):
         """Set the risk level for the AI strategy."""
         self.risk_level = max(0, min(1, level))
     
-    def get_probability_color(self, prob):
+    @staticmethod
+    def get_probability_color(prob):
         """Get color description for probability."""
-        if prob < 0.1:
-            return "GREEN (Safe)", "🟢"
-        elif prob < 0.3:
-            return "CYAN (Low Risk)", "🟦"
-        elif prob < 0.6:
-            return "YELLOW (Medium Risk)", "🟡"
-        elif prob < 0.8:
-            return "ORANGE (High Risk)", "🟠"
-        else:
-            return "RED (Very High Risk)", "🔴"
+        return probability_color(prob)
     
     def get_log_icon(self, log_type):
         """Get icon for log type."""
-        icons = {
-            "SOLVE": "🟢",
-            "LOGIC": "🔵", 
-            "PROB": "🟡",
-            "FOGIC": "🟣",
-            "ERROR": "🔴"
-        }
-        return icons.get(log_type, "⚪")
+        return _LOG_ICONS.get(log_type, "⚪")
 
 
 def print_cyberpunk_header():
@@ -82,12 +117,16 @@ def print_probability_demo():
     print("-" * 50)
     
     probabilities = [0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0]
+    if np is not None:
+        glow_lengths = (np.array(probabilities) * 10).astype(int).tolist()
+    else:
+        glow_lengths = [int(prob * 10) for prob in probabilities]
     
     print("Probability | Color          | Status         | Neon Effect")
     print("-" * 70)
     
-    for prob in probabilities:
-        color_desc, icon = NeuralUISystem().get_probability_color(prob)
+    for prob, glow_length in zip(probabilities, glow_lengths):
+        color_desc, icon = probability_color(prob)
         
         if prob < 0.1:
             status = "SAFE"
@@ -102,7 +141,7 @@ def print_probability_demo():
         
         # Simulate neon glow effect
         glow_intensity = "⚡" if prob > 0.5 else "✨"
-        glow_bar = "█" * int(prob * 10)
+        glow_bar = _BLOCKS[glow_length]
         
         print(f"{prob:9.1%} | {icon} {color_desc:13} | {status:13} | {glow_intensity} {glow_bar}")
 
@@ -163,7 +202,7 @@ def print_risk_slider_demo():
     
     for level, name, icon, description in risk_levels:
         bar_length = int(level * 20)
-        bar = "█" * bar_length + "░" * (20 - bar_length)
+        bar = _RISK_BARS[bar_length]
         print(f"{level:4.1f} | {icon} {name:12} | [{bar}] | {description}")
     
     print()
@@ -202,21 +241,28 @@ def print_animation_demo():
     print("\n✨ ANIMATION SYSTEM DEMONSTRATION:")
     print("-" * 50)
     
+    # Compute every frame's values up front; the loops below only print
+    if np is not None:
+        intensities = (128 + 127 * np.sin(np.arange(5) * np.pi / 4)).astype(int).tolist()
+        wave_lengths = (3 + 2 * np.sin(np.arange(8) * np.pi / 4)).astype(int).tolist()
+    else:
+        intensities = [int(128 + 127 * math.sin(i * math.pi / 4)) for i in range(5)]
+        wave_lengths = [int(3 + 2 * math.sin(i * math.pi / 4)) for i in range(8)]
+    alphas = [255 - i * 50 for i in range(5)]
+    
     print("🌟 Pulsing Neon Effects:")
-    for i in range(5):
-        intensity = int(128 + 127 * math.sin(i * math.pi / 4))
-        bar = "█" * (i + 1)
+    for i, intensity in enumerate(intensities):
+        bar = _BLOCKS[i + 1]
         print(f"  Frame {i+1}: {bar} (Intensity: {intensity})")
     
     print("\n🔄 Fade Effects:")
-    for i in range(5):
-        alpha = 255 - (i * 50)
-        fade_bar = "▓" * (5 - i) + "░" * i
+    for i, alpha in enumerate(alphas):
+        fade_bar = _FADES[i]
         print(f"  Fade {i+1}: {fade_bar} (Alpha: {alpha})")
     
     print("\n🌊 Wave Effects:")
-    for i in range(8):
-        wave = "∿" * int(3 + 2 * math.sin(i * math.pi / 4))
+    for i, wave_length in enumerate(wave_lengths):
+        wave = _WAVES[wave_length]
         print(f"  Wave {i+1}: {wave}")
     
     print()
@@ -1,5 +1,11 @@
 import pygame
 import math
+from collections import OrderedDict, deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # --- UI CONSTANTS ---
 BG_COLOR = (18, 18, 18)
@@ -10,130 +16,379 @@ DANGER_RED = (255, 60, 60)
 NEON_GREEN = (0, 255, 100)
 NEON_ORANGE = (255, 150, 0)
 NEON_PURPLE = (200, 100, 255)
+SHADOW_COLOR = (0, 0, 0)
+
+# Logic feed colour per log type; anything else is drawn in TEXT_GRAY
+_LOG_TYPE_COLOR = {
+    "SOLVE": NEON_GREEN,
+    "LOGIC": ACCENT_CYAN,
+    "PROB": NEON_ORANGE,
+    "FOGIC": NEON_PURPLE,
+    "ERROR": DANGER_RED,
+}
+
+# Text-mode stand-ins for the log colours, used by the text demo
+LOG_TYPE_ICONS = {
+    "SOLVE": "🟢",
+    "LOGIC": "🔵",
+    "PROB": "🟡",
+    "FOGIC": "🟣",
+    "ERROR": "🔴",
+}
+
+# Entries kept in the logic feed; older ones drop off the front
+MAX_LOGS = 12
+
+# Room left of the sidebar for the risk handle glow at level 0
+SIDEBAR_MARGIN = 12
+
+# Widest glow layer (4 * 3 px) around a probability cell
+GLOW_EXTENT = 12
+
+# Rendered text surfaces kept by NeuralUISystem._render_cached
+TEXT_CACHE_SIZE = 512
+
+# Pre-rendered button surfaces kept by NeuralUISystem.draw_button
+BUTTON_CACHE_SIZE = 64
+# Widest button glow layer (3 * 2 px) on each side
+BUTTON_HALO = 6
+
+# One period of sin() sampled into SIN_STEPS phase steps
+SIN_STEPS = 256
+_SIN_LUT = tuple(math.sin(2 * math.pi * k / SIN_STEPS) for k in range(SIN_STEPS))
+# Cell glow layers 1-4 are offset by i radians, expressed in phase steps
+_GLOW_LAYER_OFFSETS = tuple(round(i * SIN_STEPS / (2 * math.pi)) for i in (1, 2, 3, 4))
+
+
+# Animation clock resolution; pulse values are recomputed once per tick
+ANIM_TICKS_PER_SECOND = 15
+
+
+def _sin_phase(radians):
+    """Convert an angle to its index into _SIN_LUT."""
+    return int(radians * SIN_STEPS / (2 * math.pi)) % SIN_STEPS
+
+
+# Probability buckets for the colour lookup table. The ladder thresholds
+# (0.1, 0.3, 0.6, 0.8) fall exactly on bucket edges.
+PROB_STEPS = 1000
+
+
+def _probability_colors(prob):
+    """Return ((r, g, b), glow_color) for a mine probability."""
+    if prob < 0.1:
+        # Safe - Green glow
+        r = int(50 * prob)
+        g = int(255 * (1 - prob * 2))
+        b = int(100 * (1 - prob))
+        glow_color = (0, 255, 100)
+    elif prob < 0.3:
+        # Low risk - Cyan to Green
+        t = (prob - 0.1) / 0.2
+        r = int(100 * t)
+        g = 255
+        b = int(200 * (1 - t))
+        glow_color = (0, 255, 200)
+    elif prob < 0.6:
+        # Medium risk - Orange to Yellow
+        t = (prob - 0.3) / 0.3
+        r = 255
+        g = int(255 * (1 - t * 0.5))
+        b = int(50 * (1 - t))
+        glow_color = (255, 200, 0)
+    elif prob < 0.8:
+        # High risk - Red to Orange
+        t = (prob - 0.6) / 0.2
+        r = 255
+        g = int(150 * (1 - t))
+        b = int(50 * (1 - t))
+        glow_color = (255, 100, 0)
+    else:
+        # Very high risk - Purple to Red
+        t = (prob - 0.8) / 0.2
+        r = int(255 * (0.7 + 0.3 * t))
+        g = int(100 * (1 - t))
+        b = int(255 * t)
+        glow_color = (255, 60, 60)
+    return (r, g, b), glow_color
+
+
+# Precomputed colours for every probability bucket, built once at import
+_PROB_LUT = tuple(_probability_colors(i / PROB_STEPS) for i in range(PROB_STEPS + 1))
+
+
+def probability_bucket(prob):
+    """Map a probability in [0, 1] to its lookup-table index."""
+    return min(PROB_STEPS, max(0, int(prob * PROB_STEPS)))
+
+
+def _classify_cells_py(probs, buckets, percents):
+    """Fill lookup-table buckets and text percentages (-1 = no text)."""
+    for k in range(len(probs)):
+        prob = probs[k]
+        buckets[k] = min(PROB_STEPS, max(0, int(prob * PROB_STEPS)))
+        percents[k] = int(prob * 100) if 0.01 < prob < 0.99 else -1
+
+
+def classify_cells(probs):
+    """Return (buckets, percents) for a batch of cell probabilities.
+    
+    Uses NumPy when available, otherwise plain Python.
+    """
+    if np is None:
+        buckets = [0] * len(probs)
+        percents = [0] * len(probs)
+        _classify_cells_py(probs, buckets, percents)
+        return buckets, percents
+    
+    probs = np.asarray(probs, dtype=np.float64)
+    buckets = np.clip((probs * PROB_STEPS).astype(np.int64), 0, PROB_STEPS)
+    percents = np.where((probs > 0.01) & (probs < 0.99), (probs * 100).astype(np.int64), -1)
+    return buckets, percents
 
 
 class NeuralUISystem:
     def __init__(self, font_mono):
         self.font = font_mono
-        self.logic_logs = []
+        self.logic_logs = deque(maxlen=MAX_LOGS)
         self.risk_level = 0.5  # 0 = Conservative, 1 = Aggressive
         self.animation_time = 0
+        self._tick = 0
+        self._now_ms = None  # Clock sampled once per update()
+        self._text_cache = OrderedDict()
+        self._button_cache = OrderedDict()
+        self._risk_gradient_surf = None
+        self._glow_pool = {}
+        self._cell_stamps = {}
+        self._glow_stamps = {}
+        self._glow_border_masks = {}
+        self._glow_alpha = None
+        self._percent_text = None
+        self._percent_font = None
+        self._sidebar_cache = None
+        self._sidebar_key = None
+        self._sidebar_dirty = True
+        self._update_pulse()
+    
+    def _get_glow_surface(self, width, height):
+        """Return a cleared SRCALPHA scratch surface of the given size.
+        
+        Glow layers are blitted straight after drawing, so one surface per
+        size can be reused for every layer, cell, handle and button.
+        """
+        key = (width, height)
+        surf = self._glow_pool.get(key)
+        if surf is None:
+            surf = pygame.Surface(key, pygame.SRCALPHA)
+            self._glow_pool[key] = surf
+        else:
+            surf.fill((0, 0, 0, 0))
+        return surf
+    
+    def _update_pulse(self):
+        """Refresh the sin-driven glow alphas and title pulse for this tick."""
+        anim_time = self._tick / ANIM_TICKS_PER_SECOND
+        cell_phase = _sin_phase(anim_time * 0.05)
+        glow_alpha = tuple(
+            min(int(80 / i), int(100 * (1.0 + 0.3 * _SIN_LUT[(cell_phase + offset) % SIN_STEPS])))
+            for i, offset in zip((1, 2, 3, 4), _GLOW_LAYER_OFFSETS)
+        )
+        if glow_alpha != self._glow_alpha:
+            self._glow_alpha = glow_alpha
+            self._glow_stamps.clear()
+        title_phase = _sin_phase(anim_time * 0.03)
+        self._title_glow = int(128 + 127 * _SIN_LUT[title_phase])
+    
+    def _render_cached(self, text, color):
+        """Render text once per (text, color) and reuse the Surface (LRU)."""
+        key = (text, color)
+        cache = self._text_cache
+        surf = cache.get(key)
+        if surf is None:
+            surf = self.font.render(text, True, color)
+            cache[key] = surf
+            if len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surf
+    
+    def _shadowed_blits(self, text, color, offset, pos):
+        """Return the blit pairs that draw text at pos over a black drop shadow.
+        
+        Shadow and text are cached as separate Surfaces and blitted in turn,
+        so anti-aliased edges blend exactly as two direct renders would.
+        """
+        x, y = pos
+        return ((self._render_cached(text, SHADOW_COLOR), (x + offset, y + offset)),
+                (self._render_cached(text, color), (x, y)))
+    
+    def _cell_text(self, percent, rect):
+        """Return the shadow and text blit pairs for a percentage centred in rect."""
+        if self._percent_font is not self.font:
+            # Every cell label is one of "0%".."99%"; render them all once
+            # per font as (shadow, text, half width, half height)
+            self._percent_text = []
+            for i in range(100):
+                label = f"{i}%"
+                surf = self.font.render(label, True, TEXT_GRAY)
+                shadow = self.font.render(label, True, SHADOW_COLOR)
+                width, height = surf.get_size()
+                self._percent_text.append((shadow, surf, width // 2, height // 2))
+            self._percent_font = self.font
+        shadow, surf, half_w, half_h = self._percent_text[percent]
+        x, y = rect.centerx - half_w, rect.centery - half_h
+        return (shadow, (x + 1, y + 1)), (surf, (x, y))
         
     def add_log(self, message, log_type="INFO"):
         """Adds a message to the logic feed with enhanced formatting."""
         # Format with timestamp and enhanced type indicators
-        timestamp = pygame.time.get_ticks() // 1000
+        now_ms = self._now_ms if self._now_ms is not None else pygame.time.get_ticks()
+        timestamp = now_ms // 1000
         formatted_message = f"[{log_type}] {message}"
         self.logic_logs.append({
             'text': formatted_message,
             'type': log_type,
-            'timestamp': timestamp,
-            'alpha': 255
+            'timestamp': timestamp
         })
-        
-        # Keep only recent logs
-        if len(self.logic_logs) > 12:
-            self.logic_logs.pop(0)
+        self._sidebar_dirty = True
     
     def set_risk_level(self, level):
         """Set the risk level for the AI strategy."""
         self.risk_level = max(0, min(1, level))
+        self._sidebar_dirty = True
     
     def draw_probability_cell(self, surface, rect, prob, highlight=False):
         """Renders a cell with enhanced neon heat-glow based on mine probability."""
-        # Enhanced color calculation with more vibrant cyberpunk colors
-        if prob < 0.1:
-            # Safe - Green glow
-            r = int(50 * prob)
-            g = int(255 * (1 - prob * 2))
-            b = int(100 * (1 - prob))
-            glow_color = (0, 255, 100)
-        elif prob < 0.3:
-            # Low risk - Cyan to Green
-            t = (prob - 0.1) / 0.2
-            r = int(100 * t)
-            g = 255
-            b = int(200 * (1 - t))
-            glow_color = (0, 255, 200)
-        elif prob < 0.6:
-            # Medium risk - Orange to Yellow
-            t = (prob - 0.3) / 0.3
-            r = 255
-            g = int(255 * (1 - t * 0.5))
-            b = int(50 * (1 - t))
-            glow_color = (255, 200, 0)
-        elif prob < 0.8:
-            # High risk - Red to Orange
-            t = (prob - 0.6) / 0.2
-            r = 255
-            g = int(150 * (1 - t))
-            b = int(50 * (1 - t))
-            glow_color = (255, 100, 0)
-        else:
-            # Very high risk - Purple to Red
-            t = (prob - 0.8) / 0.2
-            r = int(255 * (0.7 + 0.3 * t))
-            g = int(100 * (1 - t))
-            b = int(255 * t)
-            glow_color = (255, 60, 60)
+        # Nothing of this cell, glow included, falls inside the clip area
+        if not surface.get_clip().colliderect(rect.inflate(GLOW_EXTENT, GLOW_EXTENT)):
+            return
         
         # 1. Draw the base cell with rounded corners
         pygame.draw.rect(surface, CELL_SLATE, rect, border_radius=6)
         
+        # Near-zero cells have no glow or text; only the base shows
+        if prob <= 0.01 and not highlight:
+            return
+        
+        # Enhanced color lookup with more vibrant cyberpunk colors
+        (r, g, b), glow_color = _PROB_LUT[probability_bucket(prob)]
+        
         # 2. Draw enhanced neon glow effect
         if prob > 0.01:
             # Multi-layer glow for more depth
             for i in range(4, 0, -1):
-                alpha = int(80 / i)
-                glow_intensity = 1.0 + 0.3 * math.sin(self.animation_time * 0.05 + i)
                 expanded_rect = rect.inflate(i * 3, i * 3)
                 
-                # Create glow surface
-                glow_surface = pygame.Surface((expanded_rect.width, expanded_rect.height), pygame.SRCALPHA)
-                
-                # Draw glowing border
-                border_color = (*glow_color, min(alpha, int(100 * glow_intensity)))
-                pygame.draw.rect(glow_surface, border_color, glow_surface.get_rect(), 
-                               border_radius=6 + i, width=2)
-                
-                # Apply glow with blending
+                # Apply the tinted glowing border with blending
+                glow_surface = self._glow_stamp(rect.width, rect.height, glow_color, i)
                 surface.blit(glow_surface, expanded_rect.topleft, special_flags=pygame.BLEND_ADD)
         
         # 3. Draw probability text with enhanced styling
         if 0.01 < prob < 0.99:
-            # Format percentage
-            prob_text = f"{int(prob * 100)}%"
+            # Pre-rendered percentage with shadow effect
+            surface.blits(self._cell_text(int(prob * 100), rect), doreturn=False)
+        
+        # 4. Draw highlight effect if specified
+        if highlight:
+            surface.blit(self._cell_stamp('highlight', rect.width, rect.height), rect.topleft)
+    
+    def _cell_stamp(self, kind, width, height):
+        """Return the pre-drawn base or highlight Surface for a cell size."""
+        key = (kind, width, height)
+        stamp = self._cell_stamps.get(key)
+        if stamp is None:
+            stamp = pygame.Surface((width, height), pygame.SRCALPHA)
+            color = CELL_SLATE if kind == 'base' else (*ACCENT_CYAN, 30)
+            pygame.draw.rect(stamp, color, stamp.get_rect(), border_radius=6)
+            self._cell_stamps[key] = stamp
+        return stamp
+    
+    def _glow_border_mask(self, width, height, i):
+        """Return the white rounded border for glow layer i, rasterized once."""
+        key = (width, height, i)
+        mask = self._glow_border_masks.get(key)
+        if mask is None:
+            mask = pygame.Surface((width + i * 3, height + i * 3), pygame.SRCALPHA)
+            pygame.draw.rect(mask, (255, 255, 255, 255), mask.get_rect(),
+                           border_radius=6 + i, width=2)
+            self._glow_border_masks[key] = mask
+        return mask
+    
+    def _glow_stamp(self, width, height, glow_color, i):
+        """Return glow layer i for a cell size, tinted once per pulse step."""
+        key = (width, height, glow_color, i)
+        stamp = self._glow_stamps.get(key)
+        if stamp is None:
+            # Multiplying the white mask yields exactly (*glow_color, alpha)
+            stamp = self._glow_border_mask(width, height, i).copy()
+            stamp.fill((*glow_color, self._glow_alpha[i - 1]), special_flags=pygame.BLEND_RGBA_MULT)
+            self._glow_stamps[key] = stamp
+        return stamp
+    
+    def draw_probability_cells_batch(self, surface, rects, probs, highlights=None):
+        """Render many probability cells with a single blits() call.
+        
+        Produces the same image as calling draw_probability_cell for each
+        cell in order, but classifies all probabilities in one pass and
+        reuses pre-drawn stamps instead of drawing every layer per cell.
+        """
+        buckets, percents = classify_cells(probs)
+        clip = surface.get_clip()
+        blits = []
+        for k, rect in enumerate(rects):
+            if not clip.colliderect(rect.inflate(GLOW_EXTENT, GLOW_EXTENT)):
+                continue
+            width, height = rect.width, rect.height
+            blits.append((self._cell_stamp('base', width, height), rect.topleft))
             
-            # Text with shadow effect
-            shadow_surf = self.font.render(prob_text, True, (0, 0, 0))
-            text_surf = self.font.render(prob_text, True, TEXT_GRAY)
+            if probs[k] > 0.01:
+                glow_color = _PROB_LUT[buckets[k]][1]
+                for i in range(4, 0, -1):
+                    offset = i * 3 // 2
+                    blits.append((self._glow_stamp(width, height, glow_color, i),
+                                  (rect.x - offset, rect.y - offset), None, pygame.BLEND_ADD))
             
-            text_rect = text_surf.get_rect(center=rect.center)
-            shadow_rect = shadow_surf.get_rect(center=(rect.centerx + 1, rect.centery + 1))
+            percent = percents[k]
+            if percent >= 0:
+                blits.extend(self._cell_text(percent, rect))
             
-            surface.blit(shadow_surf, shadow_rect)
-            surface.blit(text_surf, text_rect)
+            if highlights is not None and highlights[k]:
+                blits.append((self._cell_stamp('highlight', width, height), rect.topleft))
         
-        # 4. Draw highlight effect if specified
-        if highlight:
-            highlight_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(highlight_surface, (*ACCENT_CYAN, 30), highlight_surface.get_rect(), border_radius=6)
-            surface.blit(highlight_surface, rect.topleft)
+        surface.blits(blits, doreturn=False)
     
     def draw_sidebar(self, surface, x_offset):
         """Renders the enhanced terminal-style Logic Feed."""
-        # Animated title with glow effect
-        title_glow = int(128 + 127 * math.sin(self.animation_time * 0.03))
-        title_color = (0, title_glow, 200)
+        # Logs and slider only change on add_log/set_risk_level, so they are
+        # drawn once into an off-screen cache and blitted every frame
+        key = (x_offset, surface.get_size())
+        if self._sidebar_dirty or self._sidebar_key != key:
+            self._rebuild_sidebar_cache(surface, x_offset)
+        surface.blit(self._sidebar_cache, (x_offset - SIDEBAR_MARGIN, 0))
         
-        # Draw title with shadow
-        title_shadow = self.font.render("LOGIC FEED", True, (0, 0, 0))
-        title_surf = self.font.render("LOGIC FEED", True, title_color)
-        surface.blit(title_shadow, (x_offset + 2, 22))
+        # Animated title with glow effect, drawn over its cached shadow
+        title_color = (0, self._title_glow, 200)
+        title_surf = self._render_cached("LOGIC FEED", title_color)
         surface.blit(title_surf, (x_offset, 20))
+    
+    def _rebuild_sidebar_cache(self, surface, x_offset):
+        """Redraw the static part of the sidebar into self._sidebar_cache."""
+        size = (max(1, surface.get_width() - x_offset + SIDEBAR_MARGIN), surface.get_height())
+        cache = self._sidebar_cache
+        if cache is None or cache.get_size() != size:
+            cache = pygame.Surface(size, pygame.SRCALPHA)
+            self._sidebar_cache = cache
+        else:
+            cache.fill((0, 0, 0, 0))
+        x = SIDEBAR_MARGIN
+        
+        # Title shadow
+        title_shadow = self._render_cached("LOGIC FEED", SHADOW_COLOR)
+        cache.blit(title_shadow, (x + 2, 22))
         
         # Draw separator line
-        pygame.draw.line(surface, ACCENT_CYAN, (x_offset, 50), (x_offset + 180, 50), 2)
+        pygame.draw.line(cache, ACCENT_CYAN, (x, 50), (x + 180, 50), 2)
         
         # Draw logs with enhanced formatting
         y_offset = 70
@@ -142,39 +397,27 @@ class NeuralUISystem:
             log_type = log_entry['type']
             
             # Color coding based on log type
-            if log_type == "SOLVE":
-                color = NEON_GREEN
-            elif log_type == "LOGIC":
-                color = ACCENT_CYAN
-            elif log_type == "PROB":
-                color = NEON_ORANGE
-            elif log_type == "FOGIC":
-                color = NEON_PURPLE
-            elif log_type == "ERROR":
-                color = DANGER_RED
-            else:
-                color = TEXT_GRAY
+            color = _LOG_TYPE_COLOR.get(log_type, TEXT_GRAY)
             
             # Add fade effect for older logs
             alpha = max(100, 255 - (len(self.logic_logs) - i - 1) * 20)
             color = (*color, alpha)
             
             # Render log with shadow
-            shadow_surf = self.font.render(log_text, True, (0, 0, 0))
-            log_surf = self.font.render(log_text, True, color[:3])
-            
-            surface.blit(shadow_surf, (x_offset + 2, y_offset + 2))
-            surface.blit(log_surf, (x_offset, y_offset))
+            cache.blits(self._shadowed_blits(log_text, color[:3], 2, (x, y_offset)), doreturn=False)
             
             y_offset += 22
         
         # Draw risk slider section
-        self.draw_risk_slider(surface, x_offset, y_offset + 20)
+        self.draw_risk_slider(cache, x, y_offset + 20)
+        
+        self._sidebar_key = (x_offset, surface.get_size())
+        self._sidebar_dirty = False
     
     def draw_risk_slider(self, surface, x_offset, y_offset):
         """Draw the risk slider with enhanced styling."""
         # Slider title
-        slider_title = self.font.render("RISK STRATEGY", True, TEXT_GRAY)
+        slider_title = self._render_cached("RISK STRATEGY", TEXT_GRAY)
         surface.blit(slider_title, (x_offset, y_offset))
         
         # Slider track
@@ -182,16 +425,9 @@ class NeuralUISystem:
         pygame.draw.rect(surface, CELL_SLATE, track_rect, border_radius=4)
         
         # Gradient track
-        for i in range(180):
-            t = i / 180
-            if t < 0.5:
-                color = (int(255 * t * 2), 255, 0)  # Green to Yellow
-            else:
-                color = (255, int(255 * (2 - t * 2)), 0)  # Yellow to Red
-            
-            pygame.draw.line(surface, color, 
-                           (x_offset + i, y_offset + 25), 
-                           (x_offset + i, y_offset + 33))
+        if self._risk_gradient_surf is None:
+            self._risk_gradient_surf = self._build_risk_gradient(track_rect.width)
+        surface.blit(self._risk_gradient_surf, track_rect.topleft)
         
         # Slider handle
         handle_x = x_offset + int(self.risk_level * 180)
@@ -199,31 +435,70 @@ class NeuralUISystem:
         
         # Glow effect for handle
         for i in range(3, 0, -1):
-            glow_surface = pygame.Surface((handle_rect.width + i*4, handle_rect.height + i*4), pygame.SRCALPHA)
+            glow_surface = self._get_glow_surface(handle_rect.width + i*4, handle_rect.height + i*4)
             pygame.draw.rect(glow_surface, (*ACCENT_CYAN, 50 // i), glow_surface.get_rect(), border_radius=6)
             surface.blit(glow_surface, (handle_rect.x - i*2, handle_rect.y - i*2))
         
         pygame.draw.rect(surface, ACCENT_CYAN, handle_rect, border_radius=6)
         
         # Labels
-        conservative_text = self.font.render("CONSERVATIVE", True, NEON_GREEN)
-        aggressive_text = self.font.render("AGGRESSIVE", True, DANGER_RED)
+        conservative_text = self._render_cached("CONSERVATIVE", NEON_GREEN)
+        aggressive_text = self._render_cached("AGGRESSIVE", DANGER_RED)
         
         surface.blit(conservative_text, (x_offset, y_offset + 50))
         surface.blit(aggressive_text, (x_offset + 100, y_offset + 50))
     
+    def _build_risk_gradient(self, width):
+        """Paint the green-yellow-red slider gradient once into a Surface."""
+        if np is not None:
+            t = np.arange(width) / width
+            column = np.zeros((width, 3), dtype=np.uint8)
+            column[:, 0] = np.where(t < 0.5, (255 * t * 2).astype(int), 255)  # Green to Yellow
+            column[:, 1] = np.where(t < 0.5, 255, (255 * (2 - t * 2)).astype(int))  # Yellow to Red
+            # Same colour down all 9 rows of each column
+            return pygame.surfarray.make_surface(np.repeat(column[:, None, :], 9, axis=1))
+        
+        gradient = pygame.Surface((width, 9))
+        for i in range(width):
+            t = i / width
+            if t < 0.5:
+                color = (int(255 * t * 2), 255, 0)  # Green to Yellow
+            else:
+                color = (255, int(255 * (2 - t * 2)), 0)  # Yellow to Red
+            
+            pygame.draw.line(gradient, color, (i, 0), (i, 8))
+        return gradient
+    
     def update(self, dt):
         """Update animation timers."""
+        self._now_ms = pygame.time.get_ticks()
         self.animation_time += dt
-        
-        # Fade out old logs
-        for log_entry in self.logic_logs:
-            age = pygame.time.get_ticks() // 1000 - log_entry['timestamp']
-            if age > 10:
-                log_entry['alpha'] = max(50, log_entry['alpha'] - 2)
+        tick = int(self.animation_time * ANIM_TICKS_PER_SECOND)
+        if tick != self._tick:
+            self._tick = tick
+            self._update_pulse()
     
     def draw_button(self, surface, rect, text, hover=False, active=False):
         """Draw a cyberpunk-styled button."""
+        # Buttons only change with hover/active, so each state is drawn
+        # once and then blitted
+        key = (rect.width, rect.height, text, hover, active)
+        cache = self._button_cache
+        chrome = cache.get(key)
+        if chrome is None:
+            chrome = self._build_button(rect.width, rect.height, text, hover, active)
+            cache[key] = chrome
+            if len(cache) > BUTTON_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        surface.blit(chrome, (rect.x - BUTTON_HALO, rect.y - BUTTON_HALO))
+    
+    def _build_button(self, width, height, text, hover, active):
+        """Render a button with its glow halo into a new Surface."""
+        chrome = pygame.Surface((width + 2 * BUTTON_HALO, height + 2 * BUTTON_HALO), pygame.SRCALPHA)
+        rect = pygame.Rect(BUTTON_HALO, BUTTON_HALO, width, height)
+        
         # Button background
         if active:
             bg_color = ACCENT_CYAN
@@ -238,23 +513,23 @@ class NeuralUISystem:
         # Draw button with glow effect if active or hover
         if active or hover:
             for i in range(3, 0, -1):
-                glow_surface = pygame.Surface((rect.width + i*4, rect.height + i*4), pygame.SRCALPHA)
+                glow_surface = self._get_glow_surface(rect.width + i*4, rect.height + i*4)
                 glow_color = (*ACCENT_CYAN, (30 if hover else 60) // i)
                 pygame.draw.rect(glow_surface, glow_color, glow_surface.get_rect(), border_radius=8)
-                surface.blit(glow_surface, (rect.x - i*2, rect.y - i*2))
+                chrome.blit(glow_surface, (rect.x - i*2, rect.y - i*2))
         
         # Draw button background
-        pygame.draw.rect(surface, bg_color, rect, border_radius=8)
+        pygame.draw.rect(chrome, bg_color, rect, border_radius=8)
         
         # Draw button border
         border_color = ACCENT_CYAN if active or hover else CELL_SLATE
-        pygame.draw.rect(surface, border_color, rect, border_radius=8, width=2)
+        pygame.draw.rect(chrome, border_color, rect, border_radius=8, width=2)
         
         # Draw text
-        text_surf = self.font.render(text, True, text_color)
+        text_surf = self._render_cached(text, text_color)
         text_rect = text_surf.get_rect(center=rect.center)
-        surface.blit(text_surf, text_rect)
-
+        chrome.blit(text_surf, text_rect)
+        return chrome
 
 # --- EXAMPLE USAGE IN MAIN LOOP ---
 # Initialize Pygame
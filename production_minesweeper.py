@@ -7,14 +7,50 @@ Professional version with error handling, logging, configuration, and statistics
 import os
 import sys
 import json
+import atexit
 import logging
+import queue
 import random
+import tempfile
+import time
 import traceback
+from collections import deque
+from functools import lru_cache
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from advanced_solver import AdvancedMinesweeperAI
+from minesweeper_ai import neighbor_table, flat_neighbor_table
+from ansi_terminal import CLEAR_SCREEN, enable_ansi_terminal
+
+
+ANSI_COLORS = {
+    'reset': '\033[0m',
+    'red': '\033[91m',
+    'green': '\033[92m',
+    'yellow': '\033[93m',
+    'blue': '\033[94m',
+    'magenta': '\033[95m',
+    'cyan': '\033[96m',
+    'white': '\033[97m',
+    'bold': '\033[1m',
+}
+PLAIN_COLORS = {key: '' for key in ANSI_COLORS}
+
+# Board bytes: 0-8 is a revealed number
+UNKNOWN_CELL = 0xFF
+MINE_CELL = 0x80
+
+# int.bit_count() is Python 3.10+; fall back to counting binary digits
+popcount = getattr(int, 'bit_count', None) or (lambda x: bin(x).count('1'))
+
+
+@lru_cache(maxsize=None)
+def neighbor_masks(rows: int, cols: int) -> Tuple[int, ...]:
+    """Bitmask of each cell's neighbours (bit r * cols + c), indexed by flat index."""
+    return tuple(sum(1 << ni for ni in cell) for cell in flat_neighbor_table(rows, cols))
 
 
 @dataclass
@@ -55,87 +91,151 @@ class ProductionMinesweeper:
         "expert": {"rows": 20, "cols": 20, "mines": 80}
     }
     
+    # Minimum seconds between auto-saves; pending changes are always
+    # flushed on exit
+    SAVE_INTERVAL = 30.0
+    
     def __init__(self):
+        # Data directory and files, resolved once per session
+        self._dir = Path.home() / ".minesweeper_ai"
+        self._dir.mkdir(exist_ok=True)
+        self._config_path = self._dir / "config.json"
+        self._stats_path = self._dir / "stats.json"
+        
         self.setup_logging()
+        self._ansi = enable_ansi_terminal()
+        self._written = {}  # Path -> last JSON text written there
+        self._last_save = None  # time.monotonic() of the last flush
+        # Per-game generator; seed it to replay a mine layout
+        self._rng = random.Random()
         self.config = self.load_config()
         self.stats = self.load_stats()
+        self._refresh_colors()
+        self._config_dirty = False
+        self._stats_dirty = False
         self.setup_game()
-        self.game_start_time = None
+        self.game_start_time = None  # time.monotonic() when play started
         self.logger.info("Production Minesweeper initialized")
     
     def setup_logging(self):
         """Setup comprehensive logging system."""
-        log_dir = Path.home() / ".minesweeper_ai"
-        log_dir.mkdir(exist_ok=True)
-        
-        log_file = log_dir / f"minesweeper_{datetime.now().strftime('%Y%m%d')}.log"
+        log_file = self._dir / f"minesweeper_{datetime.now().strftime('%Y%m%d')}.log"
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
         
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
+            format=log_format,
+            handlers=[logging.StreamHandler(sys.stdout)]
         )
         
         self.logger = logging.getLogger(__name__)
+        self.logger.setLevel(logging.INFO)
+        if any(isinstance(h, QueueHandler) for h in self.logger.handlers):
+            return  # An earlier instance already feeds the log file
+        
+        # The queue handler sits on this module's logger so it is installed
+        # even when the host application configured the root logger first.
+        # Disk writes happen on the listener's thread, off the game loop
+        # (records arrive already formatted by the QueueHandler)
+        log_queue = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter(log_format))
+        self.logger.addHandler(queue_handler)
+        self._log_listener = QueueListener(log_queue, logging.FileHandler(log_file))
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
     
     def load_config(self) -> GameConfig:
         """Load configuration from file."""
-        config_file = Path.home() / ".minesweeper_ai" / "config.json"
+        config_file = self._config_path
         
         try:
             if config_file.exists():
-                with open(config_file, 'r') as f:
-                    data = json.load(f)
-                return GameConfig(**data)
+                return self._read_json(config_file, GameConfig)
         except Exception as e:
-            self.logger.warning(f"Failed to load config: {e}")
+            self.logger.warning("Failed to load config: %s", e)
         
         return GameConfig()
     
+    def _read_json(self, path: Path, cls):
+        """Load a settings dataclass from JSON, ignoring unknown keys."""
+        with open(path, 'r') as f:
+            text = f.read()
+        data = json.loads(text)
+        known = {field.name for field in fields(cls)}
+        # Remember what is on disk so an unchanged save is skipped
+        self._written[path] = text
+        return cls(**{key: value for key, value in data.items() if key in known})
+    
+    def _write_json(self, path: Path, data: Dict[str, Any]) -> bool:
+        """Atomically replace path with data as JSON; skip unchanged content."""
+        text = json.dumps(data, indent=2)
+        if self._written.get(path) == text and path.exists():
+            return False
+        
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile('w', dir=path.parent, suffix='.tmp', delete=False) as f:
+                tmp_name = f.name
+                f.write(text)
+            os.replace(tmp_name, path)
+        except BaseException:
+            # Never leave a half-written temp file behind
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+            raise
+        self._written[path] = text
+        return True
+    
     def save_config(self):
         """Save configuration to file."""
-        config_file = Path.home() / ".minesweeper_ai" / "config.json"
-        config_file.parent.mkdir(exist_ok=True)
+        config_file = self._config_path
         
         try:
-            with open(config_file, 'w') as f:
-                json.dump(asdict(self.config), f, indent=2)
-            self.logger.info("Configuration saved")
+            if self._write_json(config_file, vars(self.config)):
+                self.logger.info("Configuration saved")
+            self._config_dirty = False
         except Exception as e:
-            self.logger.error(f"Failed to save config: {e}")
+            self.logger.error("Failed to save config: %s", e)
     
     def load_stats(self) -> GameStats:
         """Load statistics from file."""
-        stats_file = Path.home() / ".minesweeper_ai" / "stats.json"
+        stats_file = self._stats_path
         
         try:
             if stats_file.exists():
-                with open(stats_file, 'r') as f:
-                    data = json.load(f)
-                return GameStats(**data)
+                return self._read_json(stats_file, GameStats)
         except Exception as e:
-            self.logger.warning(f"Failed to load stats: {e}")
+            self.logger.warning("Failed to load stats: %s", e)
         
         return GameStats()
     
     def save_stats(self):
         """Save statistics to file."""
-        stats_file = Path.home() / ".minesweeper_ai" / "stats.json"
-        stats_file.parent.mkdir(exist_ok=True)
+        stats_file = self._stats_path
         
         try:
-            # Update win rate
-            if self.stats.games_played > 0:
-                self.stats.win_rate = (self.stats.games_won / self.stats.games_played) * 100
-            
-            with open(stats_file, 'w') as f:
-                json.dump(asdict(self.stats), f, indent=2)
-            self.logger.info("Statistics saved")
+            if self._write_json(stats_file, vars(self.stats)):
+                self.logger.info("Statistics saved")
+            self._stats_dirty = False
         except Exception as e:
-            self.logger.error(f"Failed to save stats: {e}")
+            self.logger.error("Failed to save stats: %s", e)
+    
+    def flush(self):
+        """Write any configuration or statistics changed since the last save."""
+        if self._config_dirty:
+            self.save_config()
+        if self._stats_dirty:
+            self.save_stats()
+        self._last_save = time.monotonic()
+    
+    def autosave(self):
+        """Flush pending changes, at most once per SAVE_INTERVAL."""
+        if self._last_save is None or time.monotonic() - self._last_save >= self.SAVE_INTERVAL:
+            self.flush()
     
     def setup_game(self):
         """Setup game board based on configuration."""
@@ -143,89 +243,134 @@ class ProductionMinesweeper:
         self.rows = preset.get("rows", self.config.rows)
         self.cols = preset.get("cols", self.config.cols)
         self.mines = preset.get("mines", self.config.mines)
-        
-        self.board = [[-1 for _ in range(self.cols)] for _ in range(self.rows)]
+        self._size = self.rows * self.cols
+        # Shared per-size adjacency, by (r, c) and by flat index r * cols + c
+        self._neighbors = neighbor_table(self.rows, self.cols)
+        self._flat_neighbors = flat_neighbor_table(self.rows, self.cols)
+        self._neighbor_masks = neighbor_masks(self.rows, self.cols)
+        # Board frame lines only depend on the width
+        self._header = "   " + " ".join(f"{c:2}" for c in range(self.cols)) + "\n"
+        self._sep = "   " + "---" * self.cols + "\n"
+        
+        # One byte per cell at r * cols + c (UNKNOWN_CELL, MINE_CELL or 0-8)
+        self.board = bytearray([UNKNOWN_CELL]) * self._size
+        # Flat indices r * cols + c; (r, c) only appears at the UI boundary
         self.mine_positions = set()
+        # Bit r * cols + c of each mask is set for a mined / flagged cell
+        self.mine_mask = 0
         self.game_over = False
         self.game_won = False
         self.first_click = True
-        self.flags = set()
+        self.flag_mask = 0
+        self.flag_count = 0
         self.revealed_count = 0
         
-        self.logger.info(f"Game setup: {self.rows}x{self.cols} with {self.mines} mines")
+        # Long-lived solver fed with the cells changed since the last hint,
+        # keyed by flat index until they are handed over
+        self._ai = None
+        self._ai_changes = {}
+        
+        self.logger.info("Game setup: %dx%d with %d mines", self.rows, self.cols, self.mines)
     
-    def get_neighbors(self, r: int, c: int) -> List[Tuple[int, int]]:
+    def _get(self, r: int, c: int) -> int:
+        """Board byte of cell (r, c)."""
+        return self.board[r * self.cols + c]
+    
+    def board_rows(self) -> List[List[Any]]:
+        """The board as rows of -1 / 'M' / 0-8, the form the AI reads."""
+        cols = self.cols
+        decoded = [-1 if v == UNKNOWN_CELL else 'M' if v == MINE_CELL else v
+                   for v in self.board]
+        return [decoded[i:i + cols] for i in range(0, self._size, cols)]
+    
+    def get_neighbors(self, r: int, c: int) -> Tuple[Tuple[int, int], ...]:
         """Get all valid neighboring cells."""
-        neighbors = []
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:
-                    continue
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < self.rows and 0 <= nc < self.cols:
-                    neighbors.append((nr, nc))
-        return neighbors
+        return self._neighbors[r][c]
     
     def place_mines(self, safe_row: int, safe_col: int):
         """Place mines randomly, avoiding first clicked cell."""
-        positions = [(r, c) for r in range(self.rows) for c in range(self.cols)]
-        positions.remove((safe_row, safe_col))
+        # Cells other than the safe one, as flat indices 0..n-1
+        n = self._size - 1
         
         try:
-            self.mine_positions = set(random.sample(positions, self.mines))
-            self.logger.debug(f"Mines placed at: {self.mine_positions}")
+            if not 0 <= self.mines <= n:
+                raise ValueError("Sample larger than population or is negative")
+            
+            # Floyd's algorithm: a uniform sample in O(mines) time and memory
+            randrange = self._rng.randrange
+            chosen = set()
+            for j in range(n - self.mines, n):
+                t = randrange(j + 1)
+                chosen.add(j if t in chosen else t)
+            
+            # Skip over the safe cell to map back onto board indices
+            safe_idx = safe_row * self.cols + safe_col
+            mask = 0
+            positions = set()
+            for idx in chosen:
+                if idx >= safe_idx:
+                    idx += 1
+                mask |= 1 << idx
+                positions.add(idx)
+            self.mine_positions = positions
+            self.mine_mask = mask
+            self.logger.debug("Mines placed at: %s", self.mine_positions)
         except ValueError as e:
-            self.logger.error(f"Failed to place mines: {e}")
+            self.logger.error("Failed to place mines: %s", e)
             raise
     
-    def calculate_numbers(self):
-        """Calculate numbers for each cell."""
-        self.internal_board = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
-        
-        for r, c in self.mine_positions:
-            self.internal_board[r][c] = -1
+    def count_adjacent_mines(self, idx: int) -> int:
+        """Count the mines around flat cell index idx.
         
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.internal_board[r][c] != -1:
-                    count = sum(1 for nr, nc in self.get_neighbors(r, c) 
-                               if (nr, nc) in self.mine_positions)
-                    self.internal_board[r][c] = count
+        Numbers are computed only for cells that actually get revealed,
+        instead of for the whole board up front.
+        """
+        return popcount(self.mine_mask & self._neighbor_masks[idx])
     
     def reveal_cell(self, r: int, c: int) -> bool:
         """Reveal a cell and return True if safe, False if mine."""
         try:
-            if self.board[r][c] != -1:
+            idx = r * self.cols + c
+            if self.board[idx] != UNKNOWN_CELL:
                 return True
             
-            if (r, c) in self.mine_positions:
-                self.board[r][c] = 'M'
+            if self.mine_mask >> idx & 1:
+                self.board[idx] = MINE_CELL
+                self._ai_changes[idx] = 'M'
                 self.game_over = True
                 self.end_game(False)
-                self.logger.info(f"Game over: Mine hit at ({r}, {c})")
+                self.logger.info("Game over: Mine hit at (%d, %d)", r, c)
                 return False
             
             # Reveal the cell
-            self.board[r][c] = self.internal_board[r][c]
+            board = self.board
+            count = self.count_adjacent_mines(idx)
+            board[idx] = count
+            self._ai_changes[idx] = count
             self.revealed_count += 1
             
             # If it's a 0, reveal all adjacent cells
-            if self.internal_board[r][c] == 0:
-                to_reveal = [(r, c)]
-                revealed = set()
+            if count == 0:
+                # Breadth-first over flat indices r * cols + c; seen is a bitmap
+                flat_neighbors = self._flat_neighbors
+                pending = deque([idx])
+                seen = bytearray(self._size)
+                seen[idx] = 1
+                mine_mask = self.mine_mask
                 
-                while to_reveal:
-                    cr, cc = to_reveal.pop()
-                    if (cr, cc) in revealed:
-                        continue
-                    revealed.add((cr, cc))
-                    
-                    for nr, nc in self.get_neighbors(cr, cc):
-                        if self.board[nr][nc] == -1 and (nr, nc) not in self.mine_positions:
-                            self.board[nr][nc] = self.internal_board[nr][nc]
+                while pending:
+                    idx = pending.popleft()
+                    for ni in flat_neighbors[idx]:
+                        if seen[ni]:
+                            continue
+                        if board[ni] == UNKNOWN_CELL and not mine_mask >> ni & 1:
+                            count = self.count_adjacent_mines(ni)
+                            board[ni] = count
+                            self._ai_changes[ni] = count
                             self.revealed_count += 1
-                            if self.internal_board[nr][nc] == 0:
-                                to_reveal.append((nr, nc))
+                            if count == 0:
+                                seen[ni] = 1
+                                pending.append(ni)
             
             # Check win condition
             total_cells = self.rows * self.cols
@@ -237,22 +382,27 @@ class ProductionMinesweeper:
             return True
             
         except Exception as e:
-            self.logger.error(f"Error revealing cell ({r}, {c}): {e}")
+            self.logger.error("Error revealing cell (%d, %d): %s", r, c, e)
             return False
     
     def toggle_flag(self, r: int, c: int):
         """Toggle flag on a cell."""
         try:
-            if self.board[r][c] == -1:
-                if (r, c) in self.flags:
-                    self.flags.remove((r, c))
-                    self.logger.debug(f"Flag removed from ({r}, {c})")
+            idx = r * self.cols + c
+            if self.board[idx] == UNKNOWN_CELL:
+                bit = 1 << idx
+                self.flag_mask ^= bit
+                if not self.flag_mask & bit:
+                    self.flag_count -= 1
+                    self._ai_changes[idx] = -1
+                    self.logger.debug("Flag removed from (%d, %d)", r, c)
                 else:
-                    self.flags.add((r, c))
+                    self.flag_count += 1
+                    self._ai_changes[idx] = 'F'
                     self.stats.flags_placed += 1
-                    self.logger.debug(f"Flag placed at ({r}, {c})")
+                    self.logger.debug("Flag placed at (%d, %d)", r, c)
         except Exception as e:
-            self.logger.error(f"Error toggling flag at ({r}, {c}): {e}")
+            self.logger.error("Error toggling flag at (%d, %d): %s", r, c, e)
     
     def get_ai_suggestions(self):
         """Get AI suggestions for current board state."""
@@ -260,26 +410,42 @@ class ProductionMinesweeper:
             return set(), set(), {}
         
         try:
-            ai_board = [row[:] for row in self.board]
-            
-            for r, c in self.flags:
-                if ai_board[r][c] == -1:
-                    ai_board[r][c] = 'F'
+            # The solver works on row lists; flags arrive via the changes
+            if self._ai is None:
+                self._ai = AdvancedMinesweeperAI(self.board_rows(), verbose=False)
+            cols = self.cols
+            self._ai.apply_update({divmod(idx, cols): value
+                                   for idx, value in self._ai_changes.items()})
+            self._ai_changes = {}
             
-            ai = AdvancedMinesweeperAI(ai_board)
-            mines, safe, probs = ai.solve()
+            mines, safe, probs = self._ai.solve()
             
             self.stats.ai_suggestions_used += 1
-            return mines, safe, probs
+            return set(mines), set(safe), dict(probs)
             
         except Exception as e:
-            self.logger.error(f"Error getting AI suggestions: {e}")
+            self.logger.error("Error getting AI suggestions: %s", e)
+            # Rebuild from the full board on the next request
+            self._ai = None
+            self._ai_changes = self._flag_changes()
             return set(), set(), {}
     
+    def _flag_changes(self) -> Dict[int, str]:
+        """Every flagged cell as a pending AI update ({idx: 'F'})."""
+        changes = {}
+        flag_mask = self.flag_mask
+        while flag_mask:
+            low = flag_mask & -flag_mask
+            flag_mask ^= low
+            idx = low.bit_length() - 1
+            if self.board[idx] == UNKNOWN_CELL:
+                changes[idx] = 'F'
+        return changes
+    
     def end_game(self, won: bool):
         """Handle game end."""
-        if self.game_start_time:
-            game_time = datetime.now().timestamp() - self.game_start_time
+        if self.game_start_time is not None:
+            game_time = time.monotonic() - self.game_start_time
             self.stats.total_time += game_time
             
             if won and (self.stats.best_time == float('inf') or game_time < self.stats.best_time):
@@ -289,87 +455,91 @@ class ProductionMinesweeper:
         if won:
             self.stats.games_won += 1
             self.stats.mines_cleared += len(self.mine_positions)
+        self.stats.win_rate = (self.stats.games_won / self.stats.games_played) * 100
+        self._stats_dirty = True
         
         if self.config.auto_save:
-            self.save_stats()
+            self.autosave()
         
-        self.logger.info(f"Game ended: {'Won' if won else 'Lost'}")
+        self.logger.info("Game ended: %s", 'Won' if won else 'Lost')
     
     def get_colors(self):
         """Get color scheme based on configuration."""
-        if not self.config.color_enabled:
-            return {key: '' for key in ['reset', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white', 'bold']}
-        
-        return {
-            'reset': '\033[0m',
-            'red': '\033[91m',
-            'green': '\033[92m',
-            'yellow': '\033[93m',
-            'blue': '\033[94m',
-            'magenta': '\033[95m',
-            'cyan': '\033[96m',
-            'white': '\033[97m',
-            'bold': '\033[1m',
-        }
+        return ANSI_COLORS if self.config.color_enabled else PLAIN_COLORS
     
     def clear_screen(self):
         """Clear terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self._ansi:
+            sys.stdout.write(CLEAR_SCREEN)
+            sys.stdout.flush()
+        else:
+            os.system('cls')
+    
+    def _refresh_colors(self):
+        """Cache the color scheme and pre-render the coloured board cells.
+        
+        Call whenever config.color_enabled changes.
+        """
+        colors = self._colors = self.get_colors()
+        number_colors = {
+            1: colors['blue'], 2: colors['green'], 3: colors['red'],
+            4: colors['magenta'], 5: colors['yellow'], 6: colors['cyan'],
+            7: colors['white'], 8: colors['white']
+        }
+        # Text for every board byte; flags are laid over unknown cells
+        cell_repr = [" . "] * 256
+        cell_repr[0] = "   "
+        for n, color in number_colors.items():
+            cell_repr[n] = f"{color}{n:2} {colors['reset']}"
+        # Only a hit mine is ever revealed, and that ends the game
+        cell_repr[MINE_CELL] = f"{colors['red']}* {colors['reset']}"
+        self._cell_repr = cell_repr
+        self._flag_str = f"{colors['red']} F {colors['reset']}"
     
     def draw_board(self, show_mines: bool = False):
         """Draw game board with professional formatting."""
-        colors = self.get_colors()
-        
-        print(f"\n{colors['bold']}   MINESWEEPER AI - Production Edition{colors['reset']}")
-        print(f"   Difficulty: {self.config.difficulty.upper()} | Mines: {self.mines - len(self.flags)} | Flags: {len(self.flags)}")
+        colors = self._colors
+        # Build the whole frame in memory and write it once
+        out = [
+            f"\n{colors['bold']}   MINESWEEPER AI - Production Edition{colors['reset']}\n",
+            f"   Difficulty: {self.config.difficulty.upper()} | Mines: {self.mines - self.flag_count} | Flags: {self.flag_count}\n",
+        ]
         
-        if self.game_start_time:
-            elapsed = datetime.now().timestamp() - self.game_start_time
-            print(f"   Time: {elapsed:.1f}s")
+        if self.game_start_time is not None:
+            elapsed = time.monotonic() - self.game_start_time
+            out.append(f"   Time: {elapsed:.1f}s\n")
         
-        print()
+        out.append("\n")
         
         # Column headers
-        print("   " + " ".join(f"{c:2}" for c in range(self.cols)))
-        print("   " + "---" * self.cols)
-        
+        out.append(self._header)
+        out.append(self._sep)
+        
+        board = self.board
+        cell_repr = self._cell_repr
+        cells = [cell_repr[value] for value in board]
+        
+        # Composite flags over the cells that are still unknown
+        flag_mask = self.flag_mask
+        while flag_mask:
+            low = flag_mask & -flag_mask
+            flag_mask ^= low
+            idx = low.bit_length() - 1
+            if board[idx] == UNKNOWN_CELL:
+                cells[idx] = self._flag_str
+        
+        cols = self.cols
         for r in range(self.rows):
-            print(f"{r:2} |", end="")
-            
-            for c in range(self.cols):
-                cell_value = self.board[r][c]
-                
-                if cell_value == -1:  # Unknown
-                    if (r, c) in self.flags:
-                        print(f"{colors['red']} F {colors['reset']}", end="")
-                    else:
-                        print(" . ", end="")
-                
-                elif cell_value == 'M':  # Mine
-                    if show_mines or self.game_over:
-                        print(f"{colors['red']}* {colors['reset']}", end="")
-                    else:
-                        print(" . ", end="")
-                
-                elif isinstance(cell_value, int):  # Number
-                    if cell_value == 0:
-                        print("   ", end="")
-                    else:
-                        number_colors = {
-                            1: colors['blue'], 2: colors['green'], 3: colors['red'],
-                            4: colors['magenta'], 5: colors['yellow'], 6: colors['cyan'],
-                            7: colors['white'], 8: colors['white']
-                        }
-                        color = number_colors.get(cell_value, colors['white'])
-                        print(f"{color}{cell_value:2} {colors['reset']}", end="")
-            
-            print("|")
+            out.append(f"{r:2} |")
+            out.extend(cells[r * cols:(r + 1) * cols])
+            out.append("|\n")
         
-        print("   " + "---" * self.cols)
+        out.append(self._sep)
+        sys.stdout.write("".join(out))
     
     def show_stats(self):
         """Display comprehensive statistics."""
-        colors = self.get_colors()
+        colors = self._colors
         
         print(f"\n{colors['bold']}{colors['cyan']}📊 GAME STATISTICS{colors['reset']}")
         print("=" * 40)
@@ -390,9 +560,8 @@ class ProductionMinesweeper:
     
     def show_menu(self):
         """Display main menu."""
-        colors = self.get_colors()
-        
         while True:
+            colors = self._colors
             self.clear_screen()
             print(f"{colors['bold']}{colors['cyan']}🎮 MINESWEEPER AI - Production Edition{colors['reset']}")
             print("=" * 50)
@@ -421,8 +590,7 @@ class ProductionMinesweeper:
                 elif choice == '5':
                     self.show_help()
                 elif choice == '6':
-                    self.save_config()
-                    self.save_stats()
+                    # run() flushes pending config/stats on the way out
                     print(f"{colors['green']}Goodbye!{colors['reset']}")
                     return
                 else:
@@ -433,13 +601,13 @@ class ProductionMinesweeper:
                 print(f"\n{colors['yellow']}Exiting...{colors['reset']}")
                 return
             except Exception as e:
-                self.logger.error(f"Menu error: {e}")
+                self.logger.error("Menu error: %s", e)
                 print(f"{colors['red']}An error occurred!{colors['reset']}")
                 input(f"{colors['yellow']}Press Enter to continue...{colors['reset']}")
     
     def change_difficulty(self):
         """Change game difficulty."""
-        colors = self.get_colors()
+        colors = self._colors
         
         print(f"\n{colors['bold']}SELECT DIFFICULTY{colors['reset']}")
         print("=" * 30)
@@ -453,7 +621,8 @@ class ProductionMinesweeper:
             
             if 1 <= choice <= len(difficulties):
                 self.config.difficulty = difficulties[choice - 1]
-                self.save_config()
+                self._config_dirty = True
+                self.autosave()
                 print(f"{colors['green']}Difficulty changed to {self.config.difficulty.title()}{colors['reset']}")
             else:
                 print(f"{colors['red']}Invalid choice!{colors['reset']}")
@@ -465,9 +634,8 @@ class ProductionMinesweeper:
     
     def show_settings(self):
         """Display and modify settings."""
-        colors = self.get_colors()
-        
         while True:
+            colors = self._colors
             self.clear_screen()
             print(f"\n{colors['bold']}{colors['cyan']}⚙️ SETTINGS{colors['reset']}")
             print("=" * 30)
@@ -482,14 +650,16 @@ class ProductionMinesweeper:
                 
                 if choice == '1':
                     self.config.ai_enabled = not self.config.ai_enabled
-                    self.save_config()
+                    self._config_dirty = True
                 elif choice == '2':
                     self.config.color_enabled = not self.config.color_enabled
-                    self.save_config()
+                    self._refresh_colors()
+                    self._config_dirty = True
                 elif choice == '3':
                     self.config.auto_save = not self.config.auto_save
-                    self.save_config()
+                    self._config_dirty = True
                 elif choice == '4':
+                    self.autosave()
                     break
                 else:
                     print(f"{colors['red']}Invalid option!{colors['reset']}")
@@ -501,7 +671,7 @@ class ProductionMinesweeper:
     
     def show_help(self):
         """Display comprehensive help."""
-        colors = self.get_colors()
+        colors = self._colors
         
         help_text = f"""
 {colors['bold']}{colors['cyan']}🎮 MINESWEEPER AI - HELP{colors['reset']}
@@ -551,8 +721,9 @@ class ProductionMinesweeper:
     
     def play_game(self):
         """Main game loop."""
-        self.game_start_time = datetime.now().timestamp()
-        self.logger.info(f"Game started: {self.config.difficulty} difficulty")
+        self.game_start_time = time.monotonic()
+        self.logger.info("Game started: %s difficulty", self.config.difficulty)
+        colors = self._colors
         
         while not self.game_over and not self.game_won:
             self.clear_screen()
@@ -568,7 +739,6 @@ class ProductionMinesweeper:
                 self.draw_board(show_mines=True)
                 break
             
-            colors = self.get_colors()
             try:
                 cmd = input(f"\n{colors['bold']}Command (r/c/f/a/s/m/q): {colors['reset']}").strip().lower()
                 
@@ -598,7 +768,6 @@ class ProductionMinesweeper:
                         if action in ['r', 'c'] and 0 <= r < self.rows and 0 <= c < self.cols:
                             if self.first_click:
                                 self.place_mines(r, c)
-                                self.calculate_numbers()
                                 self.first_click = False
                             
                             self.reveal_cell(r, c)
@@ -620,13 +789,13 @@ class ProductionMinesweeper:
                 print(f"\n{colors['yellow']}Returning to menu...{colors['reset']}")
                 break
             except Exception as e:
-                self.logger.error(f"Game error: {e}")
+                self.logger.error("Game error: %s", e)
                 print(f"{colors['red']}An error occurred!{colors['reset']}")
                 input(f"{colors['yellow']}Press Enter to continue...{colors['reset']}")
     
     def show_ai_hints(self, mines, safe, probs):
         """Display AI hints."""
-        colors = self.get_colors()
+        colors = self._colors
         
         print(f"\n{colors['cyan']}🤖 AI ANALYSIS{colors['reset']}")
         print("=" * 30)
@@ -658,12 +827,11 @@ class ProductionMinesweeper:
         except KeyboardInterrupt:
             print(f"\nExiting...")
         except Exception as e:
-            self.logger.critical(f"Fatal error: {e}")
+            self.logger.critical("Fatal error: %s", e)
             self.logger.critical(traceback.format_exc())
             print(f"A critical error occurred. Check logs for details.")
         finally:
-            self.save_config()
-            self.save_stats()
+            self.flush()
 
 
 def main():
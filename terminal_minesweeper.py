@@ -6,26 +6,117 @@ A fully playable Minesweeper game in the terminal with AI assistance.
 No pygame required!
 """
 
+import heapq
 import os
 import random
+import re
 import sys
+from functools import lru_cache
 from typing import List, Tuple, Optional
 from advanced_solver import AdvancedMinesweeperAI
+from minesweeper_ai import UNKNOWN, FLAG, MINE, neighbor_table, flat_neighbor_table
+from ansi_terminal import CLEAR_SCREEN, enable_ansi_terminal
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Numbers are counted cell by cell instead
+
+try:
+    from scipy import ndimage
+except ImportError:
+    ndimage = None  # Zero regions are flood-filled on each click instead
+
+# Optional native flood fill when SciPy's region labels are unavailable
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# int.bit_count() is Python 3.10+; fall back to counting binary digits
+popcount = getattr(int, 'bit_count', None) or (lambda x: bin(x).count('1'))
+
+
+@lru_cache(maxsize=None)
+def neighbor_index_array(rows: int, cols: int) -> "np.ndarray":
+    """flat_neighbor_table() as an int32 (rows * cols, 8) array, padded with -1.
+    
+    Every cell gets the same fixed-width row, so compiled loops need no
+    bounds checks: the neighbours come first and -1 ends the row early.
+    """
+    table = np.full((rows * cols, 8), -1, dtype=np.int32)
+    for idx, neighbors in enumerate(flat_neighbor_table(rows, cols)):
+        table[idx, :len(neighbors)] = neighbors
+    return table
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _flood_numba(internal, board, start, neighbors):
+        """Uncover the zero flood around flat index start (already revealed)."""
+        # Each zero is pushed once, when it is uncovered, so size is enough
+        stack = np.empty(internal.size, np.int32)
+        stack[0] = start
+        top = 1
+        while top > 0:
+            top -= 1
+            idx = stack[top]
+            for k in range(8):
+                ni = neighbors[idx, k]
+                if ni < 0:
+                    break
+                if board[ni] == UNKNOWN and internal[ni] != MINE:
+                    board[ni] = internal[ni]
+                    if internal[ni] == 0:
+                        stack[top] = ni
+                        top += 1
+    
+    # Compile (or load from cache) now rather than on the first click, but
+    # only when it will be used: with SciPy, zero regions are precomputed
+    if ndimage is None:
+        _flood_numba(np.zeros(1, np.uint8), np.zeros(1, np.uint8), 0, neighbor_index_array(1, 1))
 
 
 class TerminalMinesweeper:
     """Terminal-based Minesweeper game with AI assistance."""
     
+    # "action row col" board commands
+    _CMD = re.compile(r'([rcf])\s+(\d+)\s+(\d+)')
+    
     def __init__(self, rows: int = 10, cols: int = 10, mines: int = 15):
         self.rows = rows
         self.cols = cols
         self.mines = mines
-        self.board = [[-1 for _ in range(cols)] for _ in range(rows)]
-        self.mine_positions = set()
+        # One byte per cell at r * cols + c, in the solver's cell codes:
+        # UNKNOWN, MINE (a revealed mine) or the revealed number 0-8
+        self.board = bytearray([UNKNOWN]) * (rows * cols)
+        # Bitboards: bit r * cols + c is set for a mined / flagged / unknown cell
+        self.mine_bb = 0
+        self.flag_bb = 0
+        self.unknown_bb = (1 << (rows * cols)) - 1
+        self.unknown_count = rows * cols  # popcount(unknown_bb), kept in step
+        # Shared per-size adjacency, by (r, c) and by flat index r * cols + c
+        self._neighbors = neighbor_table(rows, cols)
+        self._flat_neighbors = flat_neighbor_table(rows, cols)
         self.game_over = False
         self.game_won = False
         self.first_click = True
-        self.flags = set()
+        # Zero-region label per cell and the flat indices each region
+        # reveals, built by calculate_numbers when SciPy is available
+        self._zero_labels = None
+        self._zero_regions = []
+        # Long-lived solver, plus the board and flags it last saw
+        self._ai = None
+        self._ai_board = None
+        self._ai_flags = 0
+        # Last answer and the state it was computed for
+        self._ai_key = None
+        self._ai_result = None
+        
+        # Clear with an escape sequence when the terminal takes one,
+        # rather than spawning a shell for every redraw
+        self._clear_seq = CLEAR_SCREEN if sys.stdout.isatty() and enable_ansi_terminal() else None
         
         # Colors for terminal output
         self.COLORS = {
@@ -51,142 +142,292 @@ class TerminalMinesweeper:
             7: self.COLORS['white'],
             8: self.COLORS['white']
         }
+        
+        # Rendered text for every cell code; flags are laid over unknown cells
+        reset = self.COLORS['reset']
+        self._glyphs = [" . "] * (MINE + 1)
+        self._glyphs[0] = "   "
+        for n, color in self.number_colors.items():
+            self._glyphs[n] = f"{color}{n:2} {reset}"
+        self._glyphs[FLAG] = f"{self.COLORS['red']} F {reset}"
+        # Only a hit mine is ever revealed, and that ends the game
+        self._glyphs[MINE] = f"{self.COLORS['red']}💣{reset} "
     
     def clear_screen(self):
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self._clear_seq:
+            sys.stdout.write(self._clear_seq)
+            sys.stdout.flush()
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
     
-    def get_neighbors(self, r: int, c: int) -> List[Tuple[int, int]]:
+    def get_neighbors(self, r: int, c: int) -> Tuple[Tuple[int, int], ...]:
         """Get all valid neighboring cells."""
-        neighbors = []
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:
-                    continue
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < self.rows and 0 <= nc < self.cols:
-                    neighbors.append((nr, nc))
-        return neighbors
+        return self._neighbors[r][c]
     
     def place_mines(self, safe_row: int, safe_col: int):
         """Place mines randomly, avoiding the first clicked cell."""
-        positions = [(r, c) for r in range(self.rows) for c in range(self.cols)]
-        positions.remove((safe_row, safe_col))
-        self.mine_positions = set(random.sample(positions, self.mines))
+        size = self.rows * self.cols
+        if not 0 <= self.mines < size:
+            raise ValueError("Sample larger than population or is negative")
+        
+        # Rejection sampling straight into the bitboard; the safe cell
+        # starts out taken so it is redrawn like any collision
+        randrange = random.randrange
+        safe = 1 << (safe_row * self.cols + safe_col)
+        taken = safe
+        for _ in range(self.mines):
+            bit = 1 << randrange(size)
+            while taken & bit:
+                bit = 1 << randrange(size)
+            taken |= bit
+        self.mine_bb = taken ^ safe
     
     def calculate_numbers(self):
         """Calculate numbers for each cell."""
-        self.internal_board = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        # Laid out like self.board, with MINE on every mine
+        if np is not None:
+            counts = self._count_mines_numpy()
+            self.internal_board = bytearray(counts.tobytes())
+            if ndimage is not None:
+                self._label_zero_regions(counts)
+            return
         
-        for r, c in self.mine_positions:
-            self.internal_board[r][c] = -1  # Mark mines
+        cols = self.cols
+        internal = self.internal_board = bytearray(self.rows * cols)
         
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.internal_board[r][c] != -1:
-                    count = 0
-                    for nr, nc in self.get_neighbors(r, c):
-                        if self.internal_board[nr][nc] == -1:
-                            count += 1
-                    self.internal_board[r][c] = count
+        mine_bb = self.mine_bb
+        while mine_bb:
+            low = mine_bb & -mine_bb
+            mine_bb ^= low
+            internal[low.bit_length() - 1] = MINE  # Mark mines
+        
+        for idx, neighbors in enumerate(self._flat_neighbors):
+            if internal[idx] != MINE:
+                count = 0
+                for ni in neighbors:
+                    if internal[ni] == MINE:
+                        count += 1
+                internal[idx] = count
+    
+    def _count_mines_numpy(self) -> "np.ndarray":
+        """calculate_numbers() as eight shifted adds over a padded mine grid."""
+        rows, cols = self.rows, self.cols
+        size = rows * cols
+        mine_bytes = np.frombuffer(self.mine_bb.to_bytes((size + 7) // 8, 'little'), dtype=np.uint8)
+        mines = np.unpackbits(mine_bytes, count=size, bitorder='little').reshape(rows, cols)
+        
+        padded = np.pad(mines, 1)
+        counts = np.zeros_like(mines)
+        for dr in range(3):
+            for dc in range(3):
+                if dr != 1 or dc != 1:
+                    counts += padded[dr:dr + rows, dc:dc + cols]
+        counts[mines == 1] = MINE  # Mark mines
+        return counts
+    
+    def _label_zero_regions(self, counts: "np.ndarray"):
+        """Precompute what revealing any zero cell uncovers.
+        
+        A zero flood uncovers the 8-connected region of zeros around the
+        click plus the numbered cells bordering it, so each region's cells
+        are listed once here and a click just looks its region up.
+        """
+        structure = np.ones((3, 3), dtype=bool)
+        labels, _ = ndimage.label(counts == 0, structure=structure)
+        regions = [None]  # Label 0 is "not a zero cell"
+        
+        for label, (row_slice, col_slice) in enumerate(ndimage.find_objects(labels), 1):
+            # Grow the bounding box by one cell so the border fits
+            r0 = max(row_slice.start - 1, 0)
+            c0 = max(col_slice.start - 1, 0)
+            box = labels[r0:row_slice.stop + 1, c0:col_slice.stop + 1] == label
+            rs, cs = np.nonzero(ndimage.binary_dilation(box, structure=structure))
+            regions.append((rs + r0) * self.cols + (cs + c0))
+        
+        self._zero_labels = labels
+        self._zero_regions = regions
     
     def reveal_cell(self, r: int, c: int) -> bool:
-        """Reveal a cell and return True if safe, False if mine."""
-        if (r, c) in self.mine_positions:
-            self.board[r][c] = 'M'
+        """Reveal a cell and return True if safe, False if mine.
+        
+        Cells that are not unknown are left alone and count as safe.
+        """
+        cols = self.cols
+        board = self.board
+        internal = self.internal_board
+        idx = r * cols + c
+        if board[idx] != UNKNOWN:
+            # Already revealed; counting it again could fake a win
+            return True
+        if self.mine_bb >> idx & 1:
+            board[idx] = MINE
             self.game_over = True
             return False
         
         # Reveal the cell
-        self.board[r][c] = self.internal_board[r][c]
+        board[idx] = internal[idx]
+        self.unknown_bb &= ~(1 << idx)
+        self.unknown_count -= 1
         
         # If it's a 0, reveal all adjacent cells
-        if self.internal_board[r][c] == 0:
-            to_reveal = [(r, c)]
-            revealed = set()
+        if internal[idx] == 0 and self._zero_labels is not None:
+            # One gather/scatter over zero-copy views of both boards
+            cells = self._zero_regions[self._zero_labels[r, c]]
+            board_view = np.frombuffer(board, dtype=np.uint8)
+            board_view[cells] = np.frombuffer(internal, dtype=np.uint8)[cells]
+            self._sync_unknown_bb(board_view)
+        
+        elif internal[idx] == 0 and NUMBA_AVAILABLE:
+            board_view = np.frombuffer(board, dtype=np.uint8)
+            _flood_numba(np.frombuffer(internal, dtype=np.uint8), board_view,
+                         idx, neighbor_index_array(self.rows, cols))
+            self._sync_unknown_bb(board_view)
+        
+        elif internal[idx] == 0:
+            # Stack of flat indices; revealed is a per-cell bitmap
+            flat_neighbors = self._flat_neighbors
+            mine_bb = self.mine_bb
+            to_reveal = [idx]
+            revealed = bytearray(len(board))
             
             while to_reveal:
-                cr, cc = to_reveal.pop()
-                if (cr, cc) in revealed:
+                idx = to_reveal.pop()
+                if revealed[idx]:
                     continue
-                revealed.add((cr, cc))
+                revealed[idx] = 1
                 
-                for nr, nc in self.get_neighbors(cr, cc):
-                    if self.board[nr][nc] == -1 and (nr, nc) not in self.mine_positions:
-                        self.board[nr][nc] = self.internal_board[nr][nc]
-                        if self.internal_board[nr][nc] == 0:
-                            to_reveal.append((nr, nc))
-        
-        # Check win condition
-        unknown_count = sum(1 for r in range(self.rows) for c in range(self.cols) 
-                          if self.board[r][c] == -1)
-        if unknown_count == len(self.mine_positions):
+                for ni in flat_neighbors[idx]:
+                    if board[ni] == UNKNOWN and not mine_bb >> ni & 1:
+                        board[ni] = internal[ni]
+                        self.unknown_bb &= ~(1 << ni)
+                        self.unknown_count -= 1
+                        if internal[ni] == 0:
+                            to_reveal.append(ni)
+        
+        # Check win condition; mines are never uncovered without losing,
+        # so exactly `mines` unknown cells left means they are the mines
+        if self.unknown_count == self.mines:
             self.game_won = True
         
         return True
     
+    def _sync_unknown_bb(self, board_view: "np.ndarray"):
+        """Rebuild unknown_bb from the board after a bulk reveal."""
+        unknown = np.packbits(board_view == UNKNOWN, bitorder='little')
+        self.unknown_bb = int.from_bytes(unknown.tobytes(), 'little')
+        self.unknown_count = popcount(self.unknown_bb)
+    
     def toggle_flag(self, r: int, c: int):
         """Toggle flag on a cell."""
-        if self.board[r][c] == -1:
-            if (r, c) in self.flags:
-                self.flags.remove((r, c))
-            else:
-                self.flags.add((r, c))
+        if self.board[r * self.cols + c] == UNKNOWN:
+            self.flag_bb ^= 1 << (r * self.cols + c)
     
     def get_ai_suggestions(self):
         """Get AI suggestions for current board state."""
-        # Create a copy of the board for the AI
-        ai_board = [row[:] for row in self.board]
+        # Revealed numbers are fixed by the layout, so which cells are still
+        # unknown plus the flags pins the board down; the game_over flag
+        # covers the one reveal (a mine) that leaves unknown_bb alone
+        key = (self.unknown_bb, self.flag_bb, self.game_over)
+        if key == self._ai_key:
+            mines, safe, probs = self._ai_result
+            return set(mines), set(safe), dict(probs)
+        
+        # Keep one solver per game and only feed it the cells that changed
+        # since the last request, so earlier deductions carry over
+        if self._ai is None:
+            self._ai = AdvancedMinesweeperAI(self._ai_input())
+        else:
+            self._ai.apply_update(self._ai_changes())
+        self._ai_board = bytearray(self.board)
+        self._ai_flags = self.flag_bb
         
-        # Convert flags to 'F' for AI
-        for r, c in self.flags:
-            if ai_board[r][c] == -1:
-                ai_board[r][c] = 'F'
+        mines, safe, probs = self._ai.solve()
+        self._ai_key = key
+        self._ai_result = (set(mines), set(safe), dict(probs))
         
-        ai = AdvancedMinesweeperAI(ai_board)
-        mines, safe, probs = ai.solve()
+        return set(mines), set(safe), dict(probs)
+    
+    def _ai_input(self) -> List[List[int]]:
+        """The board as solver rows, with flagged unknown cells as FLAG."""
+        # The solver takes its own cell codes as they are, so the rows
+        # are sliced straight from the board
+        cols = self.cols
+        board = self.board
+        ai_board = [list(board[r * cols:(r + 1) * cols]) for r in range(self.rows)]
+        
+        # Convert flags to FLAG for AI
+        flag_bb = self.flag_bb
+        while flag_bb:
+            low = flag_bb & -flag_bb
+            flag_bb ^= low
+            r, c = divmod(low.bit_length() - 1, cols)
+            if ai_board[r][c] == UNKNOWN:
+                ai_board[r][c] = FLAG
+        
+        return ai_board
+    
+    def _ai_changes(self) -> dict:
+        """Cells changed since the solver last saw the board ({(r, c): code})."""
+        board = self.board
+        if np is not None:
+            diff = np.frombuffer(board, dtype=np.uint8) != np.frombuffer(self._ai_board, dtype=np.uint8)
+            changed = set(np.flatnonzero(diff).tolist())
+        else:
+            changed = {idx for idx, (new, old) in enumerate(zip(board, self._ai_board)) if new != old}
+        
+        flag_bb = self.flag_bb
+        toggled = flag_bb ^ self._ai_flags
+        while toggled:
+            low = toggled & -toggled
+            toggled ^= low
+            changed.add(low.bit_length() - 1)
         
-        return mines, safe, probs
+        changes = {}
+        for idx in changed:
+            value = board[idx]
+            if value == UNKNOWN and flag_bb >> idx & 1:
+                value = FLAG
+            changes[divmod(idx, self.cols)] = value
+        return changes
     
     def draw_board(self, show_mines: bool = False):
         """Draw the game board."""
-        print(f"\n{self.COLORS['bold']}   MINESWEEPER 🕵️‍♂️💣{self.COLORS['reset']}")
-        print(f"   Mines: {self.mines - len(self.flags)} | Flags: {len(self.flags)}")
-        print()
+        # Build the whole frame in memory and write it once
+        out = []
+        append = out.append
+        append(f"\n{self.COLORS['bold']}   MINESWEEPER 🕵️‍♂️💣{self.COLORS['reset']}\n")
+        flag_count = popcount(self.flag_bb)
+        append(f"   Mines: {self.mines - flag_count} | Flags: {flag_count}\n")
+        append("\n")
         
         # Column headers
-        print("   " + " ".join(f"{c:2}" for c in range(self.cols)))
-        print("   " + "---" * self.cols)
+        append("   " + " ".join(f"{c:2}" for c in range(self.cols)) + "\n")
+        append("   " + "---" * self.cols + "\n")
         
+        board = self.board
+        glyphs = self._glyphs
+        cells = [glyphs[value] for value in board]
+        
+        # Composite flags over the cells that are still unknown
+        flag_bb = self.flag_bb
+        while flag_bb:
+            low = flag_bb & -flag_bb
+            flag_bb ^= low
+            idx = low.bit_length() - 1
+            if board[idx] == UNKNOWN:
+                cells[idx] = glyphs[FLAG]
+        
+        cols = self.cols
         for r in range(self.rows):
             # Row header
-            print(f"{r:2} |", end="")
-            
-            for c in range(self.cols):
-                cell_value = self.board[r][c]
-                
-                if cell_value == -1:  # Unknown
-                    if (r, c) in self.flags:
-                        print(f"{self.COLORS['red']} F {self.COLORS['reset']}", end="")
-                    else:
-                        print(" . ", end="")
-                
-                elif cell_value == 'M':  # Mine
-                    if show_mines or self.game_over:
-                        print(f"{self.COLORS['red']}💣{self.COLORS['reset']} ", end="")
-                    else:
-                        print(" . ", end="")
-                
-                elif isinstance(cell_value, int):  # Number
-                    if cell_value == 0:
-                        print("   ", end="")
-                    else:
-                        color = self.number_colors.get(cell_value, self.COLORS['white'])
-                        print(f"{color}{cell_value:2} {self.COLORS['reset']}", end="")
-            
-            print("|")
+            append(f"{r:2} |")
+            out.extend(cells[r * cols:(r + 1) * cols])
+            append("|\n")
         
-        print("   " + "---" * self.cols)
+        append("   " + "---" * self.cols + "\n")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
     
     def show_ai_hints(self):
         """Show AI hints on the board."""
@@ -208,7 +449,7 @@ class TerminalMinesweeper:
         
         if probs and not mines and not safe:
             print(f"\n{self.COLORS['yellow']}📊 Best Guesses (lowest mine probability):{self.COLORS['reset']}")
-            sorted_probs = sorted(probs.items(), key=lambda x: x[1])[:5]
+            sorted_probs = heapq.nsmallest(5, probs.items(), key=lambda x: x[1])
             for (r, c), prob in sorted_probs:
                 status = "SAFE" if prob < 0.1 else "RISKY" if prob > 0.5 else "MODERATE"
                 print(f"   ({r}, {c}): {prob:.3f} - {status}")
@@ -216,32 +457,26 @@ class TerminalMinesweeper:
     def get_input(self):
         """Get user input."""
         while True:
-            try:
-                cmd = input(f"\n{self.COLORS['bold']}Command (r/c/f/a/h/q): {self.COLORS['reset']}").strip().lower()
-                
-                if cmd == 'q':
-                    return 'quit', None, None
-                elif cmd == 'h':
-                    return 'help', None, None
-                elif cmd == 'a':
-                    return 'ai', None, None
-                else:
-                    parts = cmd.split()
-                    if len(parts) >= 3:
-                        action = parts[0]
-                        r = int(parts[1])
-                        c = int(parts[2])
-                        
-                        if action in ['r', 'c', 'f'] and 0 <= r < self.rows and 0 <= c < self.cols:
-                            return action, r, c
-                        
-                        print(f"{self.COLORS['red']}Invalid input!{self.COLORS['reset']}")
-                    else:
-                        print(f"{self.COLORS['red']}Invalid format! Use: action row col{self.COLORS['reset']}")
-                        print(f"Actions: r(eveal), c(lear), f(lag)")
+            cmd = input(f"\n{self.COLORS['bold']}Command (r/c/f/a/h/q): {self.COLORS['reset']}").strip().lower()
             
-            except (ValueError, IndexError):
+            if cmd == 'q':
+                return 'quit', None, None
+            elif cmd == 'h':
+                return 'help', None, None
+            elif cmd == 'a':
+                return 'ai', None, None
+            
+            match = self._CMD.fullmatch(cmd)
+            if match:
+                action, r, c = match.group(1), int(match.group(2)), int(match.group(3))
+                if r < self.rows and c < self.cols:
+                    return action, r, c
+                print(f"{self.COLORS['red']}Invalid input!{self.COLORS['reset']}")
+            elif len(cmd.split()) >= 3:
                 print(f"{self.COLORS['red']}Invalid input!{self.COLORS['reset']}")
+            else:
+                print(f"{self.COLORS['red']}Invalid format! Use: action row col{self.COLORS['reset']}")
+                print(f"Actions: r(eveal), c(lear), f(lag)")
     
     def show_help(self):
         """Show help information."""
@@ -320,7 +555,7 @@ class TerminalMinesweeper:
                     self.calculate_numbers()
                     self.first_click = False
                 
-                if self.board[r][c] == -1:
+                if self.board[r * self.cols + c] == UNKNOWN:
                     self.reveal_cell(r, c)
                 else:
                     print(f"{self.COLORS['yellow']}Cell already revealed!{self.COLORS['reset']}")
@@ -0,0 +1,26 @@
+import pytest
+
+from minesweeper_ai import MinesweeperAI, UNKNOWN, FLAG, MINE, encode_board
+from advanced_solver import AdvancedMinesweeperAI
+
+
+def test_encode_board_maps_player_cells():
+    assert encode_board([[-1, 0, 8], ['F', 3, -1]]) == [[UNKNOWN, 0, 8], [FLAG, 3, UNKNOWN]]
+
+
+def test_encode_board_keeps_solver_codes():
+    assert encode_board([[UNKNOWN, FLAG], [MINE, 2]]) == [[UNKNOWN, FLAG], [MINE, 2]]
+
+
+@pytest.mark.parametrize("cell", ['?', None, 12, -2])
+def test_invalid_cells_are_rejected(cell):
+    with pytest.raises(ValueError):
+        MinesweeperAI([[1, cell], [-1, -1]])
+    with pytest.raises(ValueError):
+        AdvancedMinesweeperAI([[1, cell], [-1, -1]])
+
+
+def test_apply_update_rejects_invalid_cells():
+    ai = AdvancedMinesweeperAI([[1, -1], [-1, -1]])
+    with pytest.raises(ValueError):
+        ai.apply_update({(0, 1): '?'})
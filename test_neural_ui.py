@@ -22,16 +22,53 @@ def main():
     font_mono = pygame.font.SysFont("monospace", 14)
     ui = NeuralUISystem(font_mono)
     
-    # Test data
+    # Fonts are loaded once, not every frame
+    title_font = pygame.font.SysFont("Arial", 24, bold=True)
+    subtitle_font = pygame.font.SysFont("Arial", 14)
+    label_font = pygame.font.SysFont("Arial", 10)
+    inst_font = pygame.font.SysFont("Arial", 12)
+    
+    # Test data: one row of cells on a regular grid
+    grid_x, grid_y = 50, 50
+    cell_pitch, cell_size = 50, 40
+    cell_probs = [
+        0.0,   # Safe
+        0.1,   # Very safe
+        0.25,  # Low risk
+        0.5,   # Medium risk
+        0.75,  # High risk
+        0.9,   # Very high risk
+        1.0,   # Certain mine
+    ]
     test_cells = [
-        (pygame.Rect(50, 50, 40, 40), 0.0),    # Safe
-        (pygame.Rect(100, 50, 40, 40), 0.1),   # Very safe
-        (pygame.Rect(150, 50, 40, 40), 0.25),  # Low risk
-        (pygame.Rect(200, 50, 40, 40), 0.5),   # Medium risk
-        (pygame.Rect(250, 50, 40, 40), 0.75),  # High risk
-        (pygame.Rect(300, 50, 40, 40), 0.9),   # Very high risk
-        (pygame.Rect(350, 50, 40, 40), 1.0),   # Certain mine
+        (pygame.Rect(grid_x + i * cell_pitch, grid_y, cell_size, cell_size), prob)
+        for i, prob in enumerate(cell_probs)
     ]
+    cell_rects = [rect for rect, _ in test_cells]
+    
+    # Static text, rendered once and blitted each frame
+    title_text = title_font.render("NEURAL MINESWEEPER AI", True, (0, 255, 200))
+    title_shadow = title_font.render("NEURAL MINESWEEPER AI", True, (0, 0, 0))
+    subtitle_text = subtitle_font.render("Cyberpunk UI Demonstration", True, (180, 180, 180))
+    label_texts = [label_font.render(f"{prob:.0%}", True, (150, 150, 150))
+                   for _, prob in test_cells]
+    instructions = [
+        "SPACE: Add random log",
+        "↑/↓: Adjust risk level",
+        "Click: Interact with buttons",
+        "ESC: Exit"
+    ]
+    inst_texts = [inst_font.render(instruction, True, (120, 120, 120))
+                  for instruction in instructions]
+    
+    # Background with its grid pattern, drawn once and blitted each frame
+    background = pygame.Surface(screen.get_size())
+    background.fill((18, 18, 18))
+    for x in range(0, 800, 40):
+        pygame.draw.line(background, (25, 25, 25), (x, 0), (x, 600))
+    for y in range(0, 600, 40):
+        pygame.draw.line(background, (25, 25, 25), (0, y), (800, y))
+    background = background.convert()
     
     # Buttons
     ai_solve_rect = pygame.Rect(50, 500, 120, 40)
@@ -50,6 +87,8 @@ def main():
     mouse_pos = (0, 0)
     risk_level = 0.5
     log_counter = 0
+    shown_risk = None
+    risk_text = None
     
     print("🤖 Neural UI System Test Started")
     print("Controls:")
@@ -118,36 +157,32 @@ def main():
             ]
             ui.add_log(*random.choice(demo_logs))
         
-        # Clear screen
-        screen.fill((18, 18, 18))
-        
-        # Draw grid background pattern
-        for x in range(0, 800, 40):
-            pygame.draw.line(screen, (25, 25, 25), (x, 0), (x, 600))
-        for y in range(0, 600, 40):
-            pygame.draw.line(screen, (25, 25, 25), (0, y), (800, y))
+        # Clear screen to the grid background
+        screen.blit(background, (0, 0))
         
         # Draw title
-        title_font = pygame.font.SysFont("Arial", 24, bold=True)
-        title_text = title_font.render("NEURAL MINESWEEPER AI", True, (0, 255, 200))
-        title_shadow = title_font.render("NEURAL MINESWEEPER AI", True, (0, 0, 0))
         screen.blit(title_shadow, (152, 12))
         screen.blit(title_text, (150, 10))
         
         # Draw subtitle
-        subtitle_font = pygame.font.SysFont("Arial", 14)
-        subtitle_text = subtitle_font.render("Cyberpunk UI Demonstration", True, (180, 180, 180))
         screen.blit(subtitle_text, (250, 40))
         
-        # Draw probability cells with different probabilities
-        for i, (rect, prob) in enumerate(test_cells):
-            highlight = rect.collidepoint(mouse_pos)
-            ui.draw_probability_cell(screen, rect, prob, highlight)
-            
-            # Draw probability labels
-            label_font = pygame.font.SysFont("Arial", 10)
-            label_text = label_font.render(f"{prob:.0%}", True, (150, 150, 150))
-            screen.blit(label_text, (rect.x + 5, rect.y - 15))
+        # Cells sit on a regular grid, so the hovered one is found
+        # arithmetically instead of testing every rect
+        col, offset_x = divmod(mouse_pos[0] - grid_x, cell_pitch)
+        if (0 <= col < len(test_cells) and offset_x < cell_size
+                and 0 <= mouse_pos[1] - grid_y < cell_size):
+            hovered = col
+        else:
+            hovered = -1
+        
+        # Draw all probability cells in one batch
+        hover_mask = [i == hovered for i in range(len(cell_rects))]
+        ui.draw_probability_cells_batch(screen, cell_rects, cell_probs, hover_mask)
+        
+        # Draw probability labels
+        for i, rect in enumerate(cell_rects):
+            screen.blit(label_texts[i], (rect.x + 5, rect.y - 15))
         
         # Draw sidebar
         ui.draw_sidebar(screen, 620)
@@ -161,20 +196,13 @@ def main():
                       new_game_rect.collidepoint(mouse_pos))
         
         # Draw instructions
-        inst_font = pygame.font.SysFont("Arial", 12)
-        instructions = [
-            "SPACE: Add random log",
-            "↑/↓: Adjust risk level",
-            "Click: Interact with buttons",
-            "ESC: Exit"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            inst_text = inst_font.render(instruction, True, (120, 120, 120))
+        for i, inst_text in enumerate(inst_texts):
             screen.blit(inst_text, (50, 120 + i * 20))
         
-        # Draw current risk level
-        risk_text = inst_font.render(f"Risk Level: {risk_level:.1f}", True, (0, 255, 200))
+        # Draw current risk level, re-rendered only when it changes
+        if risk_level != shown_risk:
+            shown_risk = risk_level
+            risk_text = inst_font.render(f"Risk Level: {risk_level:.1f}", True, (0, 255, 200))
         screen.blit(risk_text, (50, 220))
         
         # Update display
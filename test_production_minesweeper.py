@@ -0,0 +1,18 @@
+import json
+
+from production_minesweeper import ProductionMinesweeper
+
+
+def test_flush_saves_stats_with_auto_save_off(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    game = ProductionMinesweeper()
+    game.config.auto_save = False
+
+    game.end_game(won=True)
+    stats_file = tmp_path / ".minesweeper_ai" / "stats.json"
+    assert not stats_file.exists()
+
+    game.flush()
+    stats = json.loads(stats_file.read_text())
+    assert stats["games_played"] == 1
+    assert stats["games_won"] == 1